@@ -11,6 +11,7 @@ import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU
 
 from homeassistant import data_entry_flow
 from homeassistant.core import (
@@ -34,6 +35,10 @@ EVENT_USER_ADDED = "user_added"
 EVENT_USER_UPDATED = "user_updated"
 EVENT_USER_REMOVED = "user_removed"
 
+# Allowed clock skew when validating access tokens
+ACCESS_TOKEN_LEEWAY = 10  # seconds
+VERIFIED_ACCESS_TOKEN_CACHE_SIZE = 256
+
 type _MfaModuleDict = dict[str, MultiFactorAuthModule]
 type _ProviderKey = tuple[str, str | None]
 type _ProviderDict = dict[_ProviderKey, AuthProvider]
@@ -184,6 +189,11 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        # Access tokens whose signature has been verified, mapped to
+        # the id of their refresh token and the time they expire
+        self._verified_access_tokens: LRU[str, tuple[str, float]] = LRU(
+            VERIFIED_ACCESS_TOKEN_CACHE_SIZE
+        )
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -647,6 +657,15 @@ class AuthManager:
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
         """Return refresh token if an access token is valid."""
+        if (verified := self._verified_access_tokens.get(token)) is not None:
+            refresh_token_id, expire_at = verified
+            # A revoked refresh token is no longer in the store
+            if time.time() < expire_at and (
+                refresh_token := self.async_get_refresh_token(refresh_token_id)
+            ):
+                return refresh_token if refresh_token.user.is_active else None
+            del self._verified_access_tokens[token]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -664,13 +683,24 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
-                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            claims = jwt_wrapper.verify_and_decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
             )
         except jwt.InvalidTokenError:
             return None
 
-        if refresh_token is None or not refresh_token.user.is_active:
+        if refresh_token is None:
+            return None
+
+        self._verified_access_tokens[token] = (
+            refresh_token.id,
+            claims["exp"] + ACCESS_TOKEN_LEEWAY,
+        )
+        if not refresh_token.user.is_active:
             return None
 
         return refresh_token
@@ -2,10 +2,12 @@
 
 import asyncio
 from asyncio import shield, timeout
-from functools import lru_cache
+from collections.abc import Iterable, Mapping
+from functools import lru_cache, partial
 from http import HTTPStatus
 import logging
-from typing import Any
+from operator import attrgetter
+from typing import Any, cast
 
 from aiohttp import web
 from aiohttp.web_exceptions import HTTPBadRequest
@@ -20,7 +22,13 @@ from homeassistant.components.http import (
     require_admin,
 )
 from homeassistant.const import (
+    ATTR_AREA_ID,
+    ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
+    ATTR_LABEL_ID,
+    ATTR_SERVICE_DATA,
     CONTENT_TYPE_JSON,
+    EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     KEY_DATA_LOGGING as DATA_LOGGING,
@@ -45,8 +53,14 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, recorder, template
-from homeassistant.helpers.json import json_dumps, json_fragment
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+    recorder,
+    template,
+)
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util.event_type import EventType
@@ -66,6 +80,9 @@ ATTR_VERSION = "version"
 DOMAIN = "api"
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+STREAM_PING_MESSAGE = f"data: {STREAM_PING_PAYLOAD}\n\n".encode()
+# Events buffered for a client before the stream is closed
+STREAM_MAX_PENDING = 4096
 SERVICE_WAIT_TIMEOUT = 10
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -133,42 +150,63 @@ class APIEventStream(HomeAssistantView):
 
     @require_admin
     async def get(self, request: web.Request) -> web.StreamResponse:
-        """Provide a streaming interface for the event bus."""
+        """Provide a streaming interface for the event bus.
+
+        The events can be narrowed down with comma separated restrict
+        (event types) and entity_id query parameters.
+        """
         hass = request.app[KEY_HASS]
         stop_obj = object()
-        to_write: asyncio.Queue[object | str] = asyncio.Queue()
+        to_write: asyncio.Queue[object | bytes] = asyncio.Queue(STREAM_MAX_PENDING)
 
-        restrict: list[EventType[Any] | str] | None = None
+        restrict: set[EventType[Any] | str] | None = None
         if restrict_str := request.query.get("restrict"):
-            restrict = [*restrict_str.split(","), EVENT_HOMEASSISTANT_STOP]
+            restrict = {*restrict_str.split(","), EVENT_HOMEASSISTANT_STOP}
+        entity_ids: set[str] | None = None
+        if entity_ids_str := request.query.get(ATTR_ENTITY_ID):
+            entity_ids = set(entity_ids_str.split(","))
 
-        async def forward_events(event: Event) -> None:
+        @ha.callback
+        def forward_events(event: Event) -> None:
             """Forward events to the open request."""
-            if restrict and event.event_type not in restrict:
+            if event.event_type == EVENT_HOMEASSISTANT_STOP:
+                data: object | bytes = stop_obj
+            elif (restrict and event.event_type not in restrict) or (
+                entity_ids and not _event_matches_entity_ids(event, entity_ids)
+            ):
                 return
+            else:
+                # The JSON of an event is cached on the event, so it is
+                # shared with every other stream and websocket subscriber
+                data = b"".join((b"data: ", json_bytes(event.json_fragment), b"\n\n"))
 
             _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
 
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
-                data = stop_obj
-            else:
-                data = json_dumps(event)
-
-            await to_write.put(data)
+            try:
+                to_write.put_nowait(data)
+            except asyncio.QueueFull:
+                # The client is not keeping up, close the stream rather
+                # than buffering events without limit
+                _LOGGER.warning(
+                    "STREAM %s closing, client is not reading events", id(stop_obj)
+                )
+                unsub_stream()
+                close_stream.set()
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
         await response.prepare(request)
 
+        close_stream = asyncio.Event()
         unsub_stream = hass.bus.async_listen(MATCH_ALL, forward_events)
 
         try:
             _LOGGER.debug("STREAM %s ATTACHED", id(stop_obj))
 
             # Fire off one message so browsers fire open event right away
-            await to_write.put(STREAM_PING_PAYLOAD)
+            to_write.put_nowait(STREAM_PING_MESSAGE)
 
-            while True:
+            while not close_stream.is_set():
                 try:
                     async with timeout(STREAM_PING_INTERVAL):
                         payload = await to_write.get()
@@ -176,22 +214,46 @@ class APIEventStream(HomeAssistantView):
                     if payload is stop_obj:
                         break
 
-                    msg = f"data: {payload}\n\n"
-                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
-                    await response.write(msg.encode("UTF-8"))
+                    _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), payload)
+                    await response.write(cast(bytes, payload))
                 except TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                    to_write.put_nowait(STREAM_PING_MESSAGE)
 
         except asyncio.CancelledError:
             _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
 
         finally:
             _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
-            unsub_stream()
+            if not close_stream.is_set():
+                unsub_stream()
 
         return response
 
 
+def _event_matches_entity_ids(event: Event, entity_ids: set[str]) -> bool:
+    """Return if an event is about one of the given entities."""
+    if event.event_type == EVENT_CALL_SERVICE:
+        # Service calls carry the targeted entities in the service data,
+        # as given by the caller
+        service_data = event.data.get(ATTR_SERVICE_DATA)
+        if not isinstance(service_data, dict):
+            return False
+        event_entity_id = service_data.get(ATTR_ENTITY_ID)
+        if isinstance(event_entity_id, str):
+            event_entity_id = event_entity_id.split(",")
+    else:
+        event_entity_id = event.data.get(ATTR_ENTITY_ID)
+        if isinstance(event_entity_id, str):
+            return event_entity_id in entity_ids
+    # Some events carry a list of entity ids
+    if isinstance(event_entity_id, list):
+        return any(
+            isinstance(entity_id, str) and entity_id.strip() in entity_ids
+            for entity_id in event_entity_id
+        )
+    return False
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -212,16 +274,23 @@ class APIStatesView(HomeAssistantView):
 
     @ha.callback
     def get(self, request: web.Request) -> web.Response:
-        """Get current states."""
+        """Get current states.
+
+        The states can be narrowed down with comma separated entity_id,
+        domain, area_id and label_id query parameters. Each given parameter
+        must match, any of its values can match. Filtered states are sorted
+        by entity_id.
+        """
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
+        all_states = _async_filtered_states(hass, request.query)
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states = (state.as_dict_json for state in all_states)
         else:
             entity_perm = user.permissions.check_entity
             states = (
                 state.as_dict_json
-                for state in hass.states.async_all()
+                for state in all_states
                 if entity_perm(state.entity_id, "read")
             )
         response = web.Response(
@@ -233,6 +302,67 @@ class APIStatesView(HomeAssistantView):
         return response
 
 
+@ha.callback
+def _async_area_entity_ids(hass: HomeAssistant, area_id: str) -> set[str]:
+    """Return the entity ids in an area."""
+    ent_reg = er.async_get(hass)
+    entity_ids = {
+        entry.entity_id for entry in er.async_entries_for_area(ent_reg, area_id)
+    }
+    # Entities without an area of their own inherit the area of their device
+    entity_ids.update(
+        entry.entity_id
+        for device in dr.async_entries_for_area(dr.async_get(hass), area_id)
+        for entry in er.async_entries_for_device(ent_reg, device.id)
+        if entry.area_id is None
+    )
+    return entity_ids
+
+
+@ha.callback
+def _async_label_entity_ids(hass: HomeAssistant, label_id: str) -> list[str]:
+    """Return the entity ids with a label."""
+    return [
+        entry.entity_id
+        for entry in er.async_entries_for_label(er.async_get(hass), label_id)
+    ]
+
+
+@ha.callback
+def _async_filtered_states(
+    hass: HomeAssistant, query: Mapping[str, str]
+) -> Iterable[ha.State]:
+    """Return the states matching the filters of a states request."""
+    domains = query[ATTR_DOMAIN].split(",") if ATTR_DOMAIN in query else None
+    entity_ids: set[str] | None = None
+    for key, resolve in (
+        (ATTR_ENTITY_ID, lambda entity_id: (entity_id,)),
+        (ATTR_AREA_ID, partial(_async_area_entity_ids, hass)),
+        (ATTR_LABEL_ID, partial(_async_label_entity_ids, hass)),
+    ):
+        if key not in query:
+            continue
+        matches = {
+            entity_id for value in query[key].split(",") for entity_id in resolve(value)
+        }
+        entity_ids = matches if entity_ids is None else entity_ids & matches
+
+    if entity_ids is None:
+        # The state machine indexes the domains, no need to look at every state
+        all_states = hass.states.async_all(domains)
+        if domains is None:
+            return all_states
+        return sorted(all_states, key=attrgetter("entity_id"))
+    states = (
+        state
+        for entity_id in sorted(entity_ids)
+        if (state := hass.states.get(entity_id)) is not None
+    )
+    if domains is None:
+        return states
+    return (state for state in states if state.domain in domains)
+
+
 class APIEntityStateView(HomeAssistantView):
     """View to handle EntityState requests."""
 
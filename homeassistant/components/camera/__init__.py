@@ -18,6 +18,7 @@ from typing import Any, Final, cast, final
 
 from aiohttp import hdrs, web
 import attr
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
@@ -67,6 +68,7 @@ from .const import (  # noqa: F401
     _DEPRECATED_STREAM_TYPE_HLS,
     _DEPRECATED_STREAM_TYPE_WEB_RTC,
     CAMERA_IMAGE_TIMEOUT,
+    CAMERA_PROXY_IMAGE_CACHE_SIZE,
     CAMERA_STREAM_SOURCE_TIMEOUT,
     CONF_DURATION,
     CONF_LOOKBACK,
@@ -127,6 +129,8 @@ TOKEN_CHANGE_INTERVAL: Final = timedelta(minutes=5)
 _RND: Final = SystemRandom()
 
 MIN_STREAM_INTERVAL: Final = 0.5  # seconds
+# Window used to measure the upstream frame rate of a still stream
+STILL_STREAM_FPS_WINDOW: Final = 10  # seconds
 
 CAMERA_SERVICE_SNAPSHOT: VolDictType = {vol.Required(ATTR_FILENAME): cv.template}
 
@@ -313,6 +317,67 @@ async def async_get_still_stream(
     return response
 
 
+class _StillStreamHub:
+    """Share camera images between the viewers of a still stream.
+
+    Every viewer polls the hub at its own pace. The hub fetches a new
+    image from the camera at most once per interval and hands the same
+    bytes to all viewers, so a slow viewer skips frames instead of
+    causing extra requests to the camera.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        image_cb: Callable[[], Awaitable[bytes | None]],
+        interval: float,
+    ) -> None:
+        """Initialize the still stream hub."""
+        self._hass = hass
+        self._image_cb = image_cb
+        self._interval = interval
+        self._image: bytes | None = None
+        self._last_fetch = -interval
+        self._fetch: asyncio.Task[bytes | None] | None = None
+        self._fetch_times: collections.deque[float] = collections.deque()
+        self.viewers = 0
+
+    async def async_get_image(self) -> bytes | None:
+        """Return the latest image, fetching a new one if it is stale."""
+        if self._fetch is None:
+            if time.monotonic() - self._last_fetch < self._interval:
+                return self._image
+            self._fetch = self._hass.async_create_task(
+                self._async_fetch(), "camera still stream fetch", eager_start=False
+            )
+        # Shield the fetch so a viewer disconnecting does not cancel
+        # the fetch for other viewers waiting on it
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> bytes | None:
+        """Fetch a new image from the camera."""
+        self._last_fetch = now = time.monotonic()
+        self._fetch_times.append(now)
+        try:
+            self._image = await self._image_cb()
+        finally:
+            self._fetch = None
+        return self._image
+
+    @property
+    def fps(self) -> float:
+        """Return the rate at which images are fetched from the camera."""
+        fetch_times = self._fetch_times
+        cutoff = time.monotonic() - STILL_STREAM_FPS_WINDOW
+        while fetch_times and fetch_times[0] < cutoff:
+            fetch_times.popleft()
+        return len(fetch_times) / STILL_STREAM_FPS_WINDOW
+
+    def get_diagnostics(self) -> dict[str, Any]:
+        """Return diagnostics information for the hub."""
+        return {"viewers": self.viewers, "fps": self.fps}
+
+
 def _get_camera_from_entity_id(hass: HomeAssistant, entity_id: str) -> Camera:
     """Get camera component from entity_id."""
     if (component := hass.data.get(DOMAIN)) is None:
@@ -508,6 +573,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
         self._rtsp_to_webrtc = False
+        self._still_stream_hubs: dict[float, _StillStreamHub] = {}
 
     @cached_property
     def entity_picture(self) -> str:
@@ -657,10 +723,31 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
-        """Generate an HTTP MJPEG stream from camera images."""
-        return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
-        )
+        """Generate an HTTP MJPEG stream from camera images.
+
+        Viewers of a stream with the same interval share the images
+        fetched from the camera.
+        """
+        if (hub := self._still_stream_hubs.get(interval)) is None:
+            hub = _StillStreamHub(self.hass, self.async_camera_image, interval)
+            self._still_stream_hubs[interval] = hub
+        hub.viewers += 1
+        try:
+            return await async_get_still_stream(
+                request, hub.async_get_image, self.content_type, interval
+            )
+        finally:
+            hub.viewers -= 1
+            if not hub.viewers:
+                del self._still_stream_hubs[interval]
+
+    @final
+    def still_stream_diagnostics(self) -> dict[str, Any]:
+        """Return viewer counts and upstream frame rates of the still streams."""
+        return {
+            str(interval): hub.get_diagnostics()
+            for interval, hub in self._still_stream_hubs.items()
+        }
 
     async def handle_async_mjpeg_stream(
         self, request: web.Request
@@ -823,14 +910,23 @@ class CameraImageView(CameraView):
     url = "/api/camera_proxy/{entity_id}"
     name = "api:camera:image"
 
+    def __init__(self, component: EntityComponent[Camera]) -> None:
+        """Initialize the camera image view."""
+        super().__init__(component)
+        self._images: LRU[tuple[str, int | None, int | None], tuple[float, Image]] = (
+            LRU(CAMERA_PROXY_IMAGE_CACHE_SIZE)
+        )
+        self._fetches: dict[
+            tuple[str, int | None, int | None], asyncio.Task[Image]
+        ] = {}
+
     async def handle(self, request: web.Request, camera: Camera) -> web.Response:
         """Serve camera image."""
         width = request.query.get("width")
         height = request.query.get("height")
         try:
-            image = await _async_get_image(
+            image = await self._async_get_image(
                 camera,
-                CAMERA_IMAGE_TIMEOUT,
                 int(width) if width else None,
                 int(height) if height else None,
             )
@@ -839,6 +935,42 @@ class CameraImageView(CameraView):
 
         return web.Response(body=image.content, content_type=image.content_type)
 
+    async def _async_get_image(
+        self, camera: Camera, width: int | None, height: int | None
+    ) -> Image:
+        """Get a camera image, shared between requests for the same size.
+
+        A snapshot is reused for frame_interval seconds and concurrent
+        requests for the same camera and size share a single fetch. Each
+        size is still fetched on its own so cameras can produce it natively.
+        """
+        key = (camera.entity_id, width, height)
+        loop = camera.hass.loop
+        if (cached := self._images.get(key)) is not None and (
+            loop.time() - cached[0] < camera.frame_interval
+        ):
+            return cached[1]
+        if (fetch := self._fetches.get(key)) is None:
+            fetch = camera.hass.async_create_task(
+                _async_get_image(camera, CAMERA_IMAGE_TIMEOUT, width, height),
+                f"camera proxy image {camera.entity_id}",
+                eager_start=False,
+            )
+            self._fetches[key] = fetch
+            fetch.add_done_callback(partial(self._async_fetch_done, key))
+        # Shield the fetch so a client disconnecting does not cancel
+        # the fetch for other requests waiting on it
+        return await asyncio.shield(fetch)
+
+    @callback
+    def _async_fetch_done(
+        self, key: tuple[str, int | None, int | None], fetch: asyncio.Task[Image]
+    ) -> None:
+        """Cache the image of a finished fetch."""
+        del self._fetches[key]
+        if not fetch.cancelled() and fetch.exception() is None:
+            self._images[key] = (asyncio.get_running_loop().time(), fetch.result())
+
 
 class CameraMjpegStream(CameraView):
     """Camera View to serve an MJPEG stream."""
@@ -26,6 +26,8 @@ CONF_DURATION: Final = "duration"
 
 CAMERA_STREAM_SOURCE_TIMEOUT: Final = 10
 CAMERA_IMAGE_TIMEOUT: Final = 10
+# Number of (entity_id, width, height) snapshots kept for the camera proxy
+CAMERA_PROXY_IMAGE_CACHE_SIZE: Final = 64
 
 
 class StreamType(StrEnum):
@@ -28,4 +28,6 @@ async def async_get_config_entry_diagnostics(
         diagnostics[entity.entity_id] = (
             camera.stream.get_diagnostics() if camera.stream else {}
         )
+        if still_streams := camera.still_stream_diagnostics():
+            diagnostics[entity.entity_id]["still_streams"] = still_streams
     return diagnostics
@@ -410,7 +410,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         ("frontend_es5", not is_dev),
     ):
         static_paths_configs.append(
-            StaticPathConfig(f"/{path}", str(root_path / path), should_cache)
+            StaticPathConfig(
+                f"/{path}",
+                str(root_path / path),
+                should_cache,
+                # The build output only changes with a new frontend release
+                immutable=should_cache,
+            )
         )
 
     static_paths_configs.append(
@@ -5,3 +5,6 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# Rows kept per bucket when downsampling: first, min, max and last
+DOWNSAMPLE_ROWS_PER_BUCKET = 4
@@ -4,11 +4,16 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+from itertools import groupby
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
+from .const import DOWNSAMPLE_ROWS_PER_BUCKET
+
 
 def entities_may_have_state_changes_after(
     hass: HomeAssistant, entity_ids: Iterable, start_time: dt, no_attributes: bool
@@ -31,3 +36,46 @@ def has_recorder_run_after(hass: HomeAssistant, run_time: dt) -> bool:
     return run_time >= process_timestamp(
         get_instance(hass).recorder_runs_manager.first.start
     )
+
+
+def downsample_compressed_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Reduce a list of compressed states to at most max_points rows.
+
+    The time range is split into equal buckets. For each bucket the
+    first and last rows are kept so transitions of non-numeric states
+    still line up, as well as the rows with the minimum and maximum
+    value for numeric states so peaks are not lost on the graph.
+    """
+    if len(states) <= max_points:
+        return states
+    first_ts: float = states[0][COMPRESSED_STATE_LAST_UPDATED]
+    num_buckets = max(1, max_points // DOWNSAMPLE_ROWS_PER_BUCKET)
+    bucket_width = (
+        states[-1][COMPRESSED_STATE_LAST_UPDATED] - first_ts
+    ) / num_buckets or 1.0
+    last_bucket = num_buckets - 1
+
+    def _bucket_idx(comp_state: dict[str, Any]) -> int:
+        return min(
+            int((comp_state[COMPRESSED_STATE_LAST_UPDATED] - first_ts) / bucket_width),
+            last_bucket,
+        )
+
+    reduced: list[dict[str, Any]] = []
+    for _, bucket in groupby(states, _bucket_idx):
+        rows = list(bucket)
+        keep = {0, len(rows) - 1}
+        numeric: list[tuple[float, int]] = []
+        for idx, comp_state in enumerate(rows):
+            try:
+                numeric.append((float(comp_state[COMPRESSED_STATE_STATE]), idx))
+            except (TypeError, ValueError):
+                # Rows of removed entities have no state
+                continue
+        if numeric:
+            keep.add(min(numeric)[1])
+            keep.add(max(numeric)[1])
+        reduced.extend(rows[idx] for idx in sorted(keep))
+    return reduced
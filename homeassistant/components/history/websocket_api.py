@@ -39,8 +39,16 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
+from .const import (
+    DOWNSAMPLE_ROWS_PER_BUCKET,
+    EVENT_COALESCE_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
+from .helpers import (
+    downsample_compressed_states,
+    entities_may_have_state_changes_after,
+    has_recorder_run_after,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -73,25 +81,30 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
     )
+    if max_points:
+        states = {
+            entity_id: downsample_compressed_states(state_list, max_points)
+            for entity_id, state_list in states.items()
+        }
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -104,6 +117,9 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(
+            int, vol.Range(min=DOWNSAMPLE_ROWS_PER_BUCKET)
+        ),
     }
 )
 @websocket_api.async_response
@@ -168,6 +184,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -21,6 +21,7 @@ from aiohttp.web import (
     middleware,
 )
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
+from lru import LRU
 import voluptuous as vol
 
 from homeassistant.config import load_yaml_config_file
@@ -39,6 +40,10 @@ KEY_FAILED_LOGIN_ATTEMPTS = AppKey[defaultdict[IPv4Address | IPv6Address, int]](
     "ha_failed_login_attempts"
 )
 KEY_LOGIN_THRESHOLD = AppKey[int]("ban_manager.ip_bans_lookup")
+KEY_REMOTE_HOSTS = AppKey["LRU[IPv4Address | IPv6Address, str]"]("ha_remote_hosts")
+
+# Number of reverse DNS lookups of failed login sources to remember
+REMOTE_HOST_CACHE_SIZE: Final = 256
 
 NOTIFICATION_ID_BAN: Final = "ip-ban"
 NOTIFICATION_ID_LOGIN: Final = "http-login"
@@ -58,6 +63,7 @@ def setup_bans(hass: HomeAssistant, app: Application, login_threshold: int) -> N
     app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict[IPv4Address | IPv6Address, int](int)
     app[KEY_LOGIN_THRESHOLD] = login_threshold
     app[KEY_BAN_MANAGER] = IpBanManager(hass)
+    app[KEY_REMOTE_HOSTS] = LRU(REMOTE_HOST_CACHE_SIZE)
 
     async def ban_startup(app: Application) -> None:
         """Initialize bans when app starts up."""
@@ -115,11 +121,19 @@ async def process_wrong_login(request: Request) -> None:
 
     assert request.remote
     remote_addr = ip_address(request.remote)
-    remote_host = request.remote
-    with suppress(herror):
-        remote_host, _, _ = await hass.async_add_executor_job(
-            gethostbyaddr, request.remote
-        )
+    # Repeated failures from the same address reuse the reverse lookup
+    # instead of tying up an executor thread for every attempt
+    remote_hosts = request.app.get(KEY_REMOTE_HOSTS)
+    if remote_hosts is not None and remote_addr in remote_hosts:
+        remote_host = remote_hosts[remote_addr]
+    else:
+        remote_host = request.remote
+        with suppress(herror):
+            remote_host, _, _ = await hass.async_add_executor_job(
+                gethostbyaddr, request.remote
+            )
+        if remote_hosts is not None:
+            remote_hosts[remote_addr] = remote_host
 
     base_msg = (
         "Login attempt or request with invalid authentication from"
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from http import HTTPStatus
 from pathlib import Path
 from typing import Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.hdrs import ACCEPT_ENCODING, CACHE_CONTROL, CONTENT_TYPE, ETAG
+from aiohttp.web import BaseRequest, FileResponse, Request, Response, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -16,11 +18,37 @@ CACHE_TIME: Final = 31 * 86400  # = 1 month
 CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
+# ETag of the file variant last served for a path and Accept-Encoding
+ETAG_CACHE: LRU[tuple[str, Path, str], str] = LRU(512)
+
+
+class _CachingFileResponse(FileResponse):
+    """File response that remembers the ETag it was served with."""
+
+    def __init__(
+        self, path: Path, chunk_size: int, etag_key: tuple[str, Path, str]
+    ) -> None:
+        """Initialize the file response."""
+        super().__init__(path, chunk_size=chunk_size)
+        self._etag_key = etag_key
+
+    async def prepare(self, request: BaseRequest) -> AbstractStreamWriter | None:
+        """Prepare the response and remember the ETag of the served file."""
+        writer = await super().prepare(request)
+        if (
+            self.status in (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED)
+            and (etag := self.etag) is not None
+        ):
+            ETAG_CACHE[self._etag_key] = etag.value
+        return writer
 
 
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
 
+    # Whether the files never change while Home Assistant is running
+    _immutable = False
+
     async def _handle(self, request: Request) -> StreamResponse:
         """Wrap base handler to cache file path resolution and content type guess."""
         rel_url = request.match_info["filename"]
@@ -29,8 +57,31 @@ class CachingStaticResource(StaticResource):
 
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
+            etag_key = (
+                rel_url,
+                self._directory,
+                request.headers.get(ACCEPT_ENCODING, "").lower(),
+            )
+            # Files of immutable resources do not change, so a matching
+            # ETag can be answered without touching the disk
+            if (
+                self._immutable
+                and (etag_value := ETAG_CACHE.get(etag_key)) is not None
+                and (if_none_match := request.if_none_match) is not None
+                and any(
+                    etag.value == etag_value and not etag.is_weak
+                    for etag in if_none_match
+                )
+            ):
+                response = Response(
+                    status=HTTPStatus.NOT_MODIFIED, headers={ETAG: f'"{etag_value}"'}
+                )
+            elif self._immutable:
+                response = _CachingFileResponse(file_path, self._chunk_size, etag_key)
+                response.headers[CONTENT_TYPE] = content_type
+            else:
+                response = FileResponse(file_path, chunk_size=self._chunk_size)
+                response.headers[CONTENT_TYPE] = content_type
         else:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
@@ -46,3 +97,9 @@ class CachingStaticResource(StaticResource):
 
         response.headers[CACHE_CONTROL] = CACHE_HEADER
         return response
+
+
+class ImmutableStaticResource(CachingStaticResource):
+    """Caching Static Resource handler for files that never change."""
+
+    _immutable = True
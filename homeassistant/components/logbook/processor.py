@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Generator, Sequence
-from dataclasses import dataclass
+from collections.abc import Callable, Generator, Iterable, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 import logging
 import time
@@ -99,6 +99,7 @@ class LogbookRun:
     include_entity_name: bool
     timestamp: bool
     memoize_new_contexts: bool = True
+    context_augment_cache: dict[bytes, dict[str, Any]] = field(default_factory=dict)
 
 
 class EventProcessor:
@@ -148,6 +149,7 @@ class EventProcessor:
         """
         self.logbook_run.event_cache.clear()
         self.logbook_run.context_lookup.clear()
+        self.logbook_run.context_augment_cache.clear()
         self.logbook_run.memoize_new_contexts = False
 
     def get_events(
@@ -220,11 +222,19 @@ def _humanify(
     context_id_bin: bytes
     data: dict[str, Any]
 
+    # Index every context in the window before processing so each
+    # row resolves its origin with a single dict lookup, including
+    # parent contexts that sort after the rows that reference them
+    rows_to_process: Iterable[Row | EventAsRow] = rows
+    if memoize_new_contexts:
+        rows_to_process = list(rows)
+        for row in rows_to_process:
+            if (context_id_bin := row[CONTEXT_ID_BIN_POS]) not in context_lookup:
+                context_lookup[context_id_bin] = row
+
     # Process rows
-    for row in rows:
+    for row in rows_to_process:
         context_id_bin = row[CONTEXT_ID_BIN_POS]
-        if memoize_new_contexts and context_id_bin not in context_lookup:
-            context_lookup[context_id_bin] = row
         if row[CONTEXT_ONLY_POS]:
             continue
         event_type = row[EVENT_TYPE_POS]
@@ -320,6 +330,7 @@ class ContextAugmenter:
         self.external_events = logbook_run.external_events
         self.event_cache = logbook_run.event_cache
         self.include_entity_name = logbook_run.include_entity_name
+        self.augment_cache = logbook_run.context_augment_cache
 
     def get_context(
         self, context_id_bin: bytes | None, row: Row | EventAsRow | None
@@ -339,6 +350,22 @@ class ContextAugmenter:
 
     def augment(self, data: dict[str, Any], context_row: Row | EventAsRow) -> None:
         """Augment data from the row and cache."""
+        context_id_bin = context_row[CONTEXT_ID_BIN_POS]
+        # Only rows indexed in the context lookup are stable for the
+        # lifetime of the run so only those can be cached by context id
+        if context_id_bin is None or self.context_lookup.get(context_id_bin) is not (
+            context_row
+        ):
+            data.update(self._context_data(context_row))
+            return
+        if (context_data := self.augment_cache.get(context_id_bin)) is None:
+            context_data = self._context_data(context_row)
+            self.augment_cache[context_id_bin] = context_data
+        data.update(context_data)
+
+    def _context_data(self, context_row: Row | EventAsRow) -> dict[str, Any]:
+        """Build the context data for a context row."""
+        data: dict[str, Any] = {}
         event_type = context_row[EVENT_TYPE_POS]
         # State change
         if context_entity_id := context_row[ENTITY_ID_POS]:
@@ -348,7 +375,7 @@ class ContextAugmenter:
                 data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(
                     context_entity_id
                 )
-            return
+            return data
 
         # Call service
         if event_type == EVENT_CALL_SERVICE:
@@ -357,10 +384,10 @@ class ContextAugmenter:
             data[CONTEXT_DOMAIN] = event_data.get(ATTR_DOMAIN)
             data[CONTEXT_SERVICE] = event_data.get(ATTR_SERVICE)
             data[CONTEXT_EVENT_TYPE] = event_type
-            return
+            return data
 
         if event_type not in self.external_events:
-            return
+            return data
 
         domain, describe_event = self.external_events[event_type]
         data[CONTEXT_EVENT_TYPE] = event_type
@@ -370,7 +397,7 @@ class ContextAugmenter:
             described = describe_event(event)
         except Exception:
             _LOGGER.exception("Error with %s describe event for %s", domain, event_type)
-            return
+            return data
         if name := described.get(LOGBOOK_ENTRY_NAME):
             data[CONTEXT_NAME] = name
         if message := described.get(LOGBOOK_ENTRY_MESSAGE):
@@ -379,10 +406,11 @@ class ContextAugmenter:
         if source := described.get(LOGBOOK_ENTRY_SOURCE):
             data[CONTEXT_SOURCE] = source
         if not (attr_entity_id := described.get(LOGBOOK_ENTRY_ENTITY_ID)):
-            return
+            return data
         data[CONTEXT_ENTITY_ID] = attr_entity_id
         if self.include_entity_name:
             data[CONTEXT_ENTITY_ID_NAME] = self.entity_name_cache.get(attr_entity_id)
+        return data
 
 
 def _rows_ids_match(row: Row | EventAsRow, other_row: Row | EventAsRow) -> bool:
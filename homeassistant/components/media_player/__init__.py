@@ -490,6 +490,12 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "supported_features",
 }
 
+# Lists these are calculated from must be reassigned, not mutated in place,
+# for the cached value to be invalidated
+DERIVED_CACHED_PROPERTIES = {
+    "capability_attributes": {"sound_mode_list", "source_list", "supported_features"},
+}
+
 
 @lru_cache
 def _url_hash(url: str) -> str:
@@ -497,7 +503,11 @@ def _url_hash(url: str) -> str:
     return hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
 
 
-class MediaPlayerEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
+class MediaPlayerEntity(
+    Entity,
+    cached_properties=CACHED_PROPERTIES_WITH_ATTR_,
+    derived_cached_properties=DERIVED_CACHED_PROPERTIES,
+):
     """ABC for media player entities."""
 
     _entity_component_unrecorded_attributes = frozenset(
@@ -1078,7 +1088,7 @@ class MediaPlayerEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             f"token={self.access_token}&cache={image_hash}"
         )
 
-    @property
+    @cached_property
     def capability_attributes(self) -> dict[str, Any]:
         """Return capability attributes."""
         data: dict[str, Any] = {}
@@ -429,10 +429,13 @@ class MpdDevice(MediaPlayerEntity):
     async def _update_playlists(self, **kwargs: Any) -> None:
         """Update available MPD playlists."""
         try:
-            self._attr_source_list = []
+            source_list: list[str] = []
             with suppress(mpd.ConnectionError):
-                for playlist_data in await self._client.listplaylists():
-                    self._attr_source_list.append(playlist_data["playlist"])
+                source_list = [
+                    playlist_data["playlist"]
+                    for playlist_data in await self._client.listplaylists()
+                ]
+            self._attr_source_list = source_list
         except mpd.CommandError as error:
             self._attr_source_list = None
             LOGGER.warning("Playlists could not be updated: %s:", error)
@@ -298,14 +298,15 @@ class PandoraMediaPlayer(MediaPlayerEntity):
         self._send_station_list_command()
         station_lines = self._pianobar.before.decode("utf-8")
         _LOGGER.debug("Getting stations: %s", station_lines)
-        self._attr_source_list = []
+        source_list = []
         for line in station_lines.split("\r\n"):
             if match := re.search(r"\d+\).....(.+)", line):
                 station = match.group(1).strip()
                 _LOGGER.debug("Found station %s", station)
-                self._attr_source_list.append(station)
+                source_list.append(station)
             else:
                 _LOGGER.debug("No station match on %s", line)
+        self._attr_source_list = source_list
         self._pianobar.sendcontrol("m")  # press enter with blank line
         self._pianobar.sendcontrol("m")  # do it twice in case an 'i' got in
 
@@ -18,7 +18,10 @@ from homeassistant.const import (
 from homeassistant.core import Context, State
 import homeassistant.util.dt as dt_util
 
-from .state_attributes import decode_attributes_from_source
+from .state_attributes import (
+    attributes_json_fragment_from_source,
+    decode_attributes_from_source,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -126,10 +129,15 @@ def row_to_compressed_state(
     last_updated_ts: float | None,
     no_attributes: bool,
 ) -> dict[str, Any]:
-    """Convert a database row to a compressed state schema 41 and later."""
+    """Convert a database row to a compressed state schema 41 and later.
+
+    Compressed states are only used to build json responses so the
+    attributes are passed through as a json fragment instead of
+    being decoded and encoded again.
+    """
     comp_state: dict[str, Any] = {COMPRESSED_STATE_STATE: state}
     if not no_attributes:
-        comp_state[COMPRESSED_STATE_ATTRIBUTES] = decode_attributes_from_source(
+        comp_state[COMPRESSED_STATE_ATTRIBUTES] = attributes_json_fragment_from_source(
             getattr(row, "attributes", None), attr_cache
         )
     row_last_updated_ts: float = last_updated_ts or start_time_ts  # type: ignore[assignment]
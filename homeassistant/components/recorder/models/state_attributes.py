@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from homeassistant.helpers.json import json_fragment
 from homeassistant.util.json import json_loads_object
 
 EMPTY_JSON_OBJECT = "{}"
@@ -25,3 +26,19 @@ def decode_attributes_from_source(
         _LOGGER.exception("Error converting row to state attributes: %s", source)
         attr_cache[source] = attributes = {}
     return attributes
+
+
+def attributes_json_fragment_from_source(
+    source: Any, attr_cache: dict[str, dict[str, Any]]
+) -> dict[str, Any] | json_fragment:
+    """Wrap the stored attributes json from a row source without decoding it.
+
+    The attributes are stored as a json object by the recorder so
+    they can be spliced directly into a json response. Anything that
+    does not look like a json object falls back to decoding.
+    """
+    if not source or source == EMPTY_JSON_OBJECT:
+        return {}
+    if type(source) is str and source[0] == "{" and source[-1] == "}":
+        return json_fragment(source)
+    return decode_attributes_from_source(source, attr_cache)
@@ -44,6 +44,18 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+def get_shared_attributes_hashes() -> StatementLambdaElement:
+    """Load all shared attributes hashes from the database."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.hash).where(StateAttributes.hash.is_not(None))
+    )
+
+
+def get_shared_attributes_hashes_count() -> StatementLambdaElement:
+    """Count the shared attributes hashes in the database."""
+    return lambda_stmt(lambda: select(func.count(StateAttributes.hash)))
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
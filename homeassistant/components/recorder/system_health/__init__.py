@@ -72,4 +72,9 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    cache_stats: dict[str, Any] = {}
+    if (
+        hit_rate := instance.state_attributes_manager.stats["cache_hit_rate"]
+    ) is not None:
+        cache_stats["attributes_cache_hit_rate"] = f"{hit_rate:.1%}"
+    return db_runs | db_stats | db_engine_info | cache_stats
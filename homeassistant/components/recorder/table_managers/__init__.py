@@ -11,6 +11,60 @@ from homeassistant.util.event_type import EventType
 if TYPE_CHECKING:
     from ..core import Recorder
 
+# 16 bits per item with 3 probes gives a false positive
+# rate of roughly 0.5% when the filter is at capacity
+BLOOM_BITS_PER_ITEM = 16
+BLOOM_NUM_PROBES = 3
+BLOOM_MIN_BITS = 1 << 16
+
+
+class HashBloomFilter:
+    """Bloom filter over the 32-bit hashes stored in the shared data tables.
+
+    The filter answers "definitely not in the database" for hashes
+    that were never added, which allows the table managers to skip
+    the SELECT for data that has never been seen before. Items
+    cannot be removed so purged rows will show up as false positives
+    until the filter is rebuilt.
+    """
+
+    __slots__ = ("_bits", "_mask", "capacity", "count")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the filter sized for capacity items."""
+        num_bits = BLOOM_MIN_BITS
+        while num_bits < capacity * BLOOM_BITS_PER_ITEM:
+            num_bits <<= 1
+        self._bits = bytearray(num_bits >> 3)
+        self._mask = num_bits - 1
+        self.capacity = num_bits // BLOOM_BITS_PER_ITEM
+        self.count = 0
+
+    def _positions(self, data_hash: int) -> tuple[int, ...]:
+        """Return the bit positions for a hash using double hashing."""
+        mask = self._mask
+        step = ((data_hash * 0x9E3779B97F4A7C15) >> 32) | 1
+        return tuple((data_hash + i * step) & mask for i in range(BLOOM_NUM_PROBES))
+
+    def add(self, data_hash: int) -> None:
+        """Add a hash to the filter."""
+        bits = self._bits
+        for pos in self._positions(data_hash):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, data_hash: int) -> bool:
+        """Return if the hash may have been added to the filter."""
+        bits = self._bits
+        return all(
+            bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(data_hash)
+        )
+
+    @property
+    def overfilled(self) -> bool:
+        """Return if the filter holds more items than it was sized for."""
+        return self.count > self.capacity
+
 
 class BaseTableManager[_DataT]:
     """Base class for table managers."""
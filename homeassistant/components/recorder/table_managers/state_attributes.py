@@ -13,9 +13,13 @@ from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
-from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from ..queries import (
+    get_shared_attributes,
+    get_shared_attributes_hashes,
+    get_shared_attributes_hashes_count,
+)
+from ..util import DEFAULT_YIELD_STATES_ROWS, execute_stmt_lambda_element
+from . import BaseLRUTableManager, HashBloomFilter
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -37,6 +41,25 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        self._hash_filter: HashBloomFilter | None = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._filter_negatives = 0
+        self._filter_false_positives = 0
+
+    @property
+    def stats(self) -> dict[str, int | float | None]:
+        """Return the cache and hash filter statistics."""
+        lookups = self._cache_hits + self._cache_misses
+        hash_filter = self._hash_filter
+        return {
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "cache_hit_rate": self._cache_hits / lookups if lookups else None,
+            "filter_items": hash_filter.count if hash_filter else None,
+            "filter_negatives": self._filter_negatives,
+            "filter_false_positives": self._filter_false_positives,
+        }
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -60,13 +83,34 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
+        hash_filter = self._ensure_hash_filter(session)
+        hashes = {
             StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
             for event in events
             if (shared_attrs_bytes := self.serialize_from_event(event))
-        }:
+        }
+        if hash_filter is not None:
+            # Hashes that were never written to the database can't be loaded
+            unseen_hashes = {
+                data_hash for data_hash in hashes if data_hash not in hash_filter
+            }
+            self._filter_negatives += len(unseen_hashes)
+            hashes -= unseen_hashes
+        if hashes:
             self._load_from_hashes(hashes, session)
 
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is not None:
+            self._cache_hits += 1
+        else:
+            self._cache_misses += 1
+        return attributes_id
+
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
         """Resolve shared_attrs to the attributes_id.
 
@@ -85,16 +129,65 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """
         results: dict[str, int | None] = {}
         missing_hashes: set[int] = set()
+        hash_filter = self._ensure_hash_filter(session)
+        # The cache statistics are counted in get_from_cache, which the
+        # recorder always consults before falling back to this lookup
         for shared_attrs, data_hash in shared_attrs_data_hashes:
             if (attributes_id := self._id_map.get(shared_attrs)) is None:
-                missing_hashes.add(data_hash)
+                # The hash has never been written to the database
+                # so there is no need to look it up
+                if hash_filter is not None and data_hash not in hash_filter:
+                    self._filter_negatives += 1
+                else:
+                    missing_hashes.add(data_hash)
 
             results[shared_attrs] = attributes_id
 
         if not missing_hashes:
             return results
 
-        return results | self._load_from_hashes(missing_hashes, session)
+        loaded = self._load_from_hashes(missing_hashes, session)
+        if hash_filter is not None:
+            self._filter_false_positives += sum(
+                1
+                for shared_attrs, attributes_id in results.items()
+                if attributes_id is None and shared_attrs not in loaded
+            )
+        return results | loaded
+
+    def _ensure_hash_filter(self, session: Session) -> HashBloomFilter | None:
+        """Build the hash filter from the database if it is missing or overfilled.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (
+            hash_filter := self._hash_filter
+        ) is not None and not hash_filter.overfilled:
+            return hash_filter
+        with session.no_autoflush:
+            count: int = (
+                session.connection()
+                .execute(get_shared_attributes_hashes_count())
+                .scalar_one()
+            )
+            # Leave room for the filter to grow before it has to be rebuilt
+            hash_filter = HashBloomFilter(count * 2)
+            # Stream the hashes into the filter so they are never all
+            # held in memory at once
+            for (data_hash,) in (
+                session.connection()
+                .execute(get_shared_attributes_hashes())
+                .yield_per(DEFAULT_YIELD_STATES_ROWS)
+            ):
+                hash_filter.add(data_hash)
+        # Attributes waiting to be committed are already in the
+        # session and may be flushed before the next lookup
+        for db_state_attributes in self._pending.values():
+            if db_state_attributes.hash is not None:
+                hash_filter.add(db_state_attributes.hash)
+        self._hash_filter = hash_filter
+        return hash_filter
 
     def _load_from_hashes(
         self, hashes: Collection[int], session: Session
@@ -132,10 +225,22 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        hash_filter = self._hash_filter
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            if hash_filter is not None and db_state_attributes.hash is not None:
+                hash_filter.add(db_state_attributes.hash)
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._hash_filter = None
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
@@ -182,10 +182,20 @@ CACHED_PROPERTIES_WITH_ATTR_ = {
     "suggested_unit_of_measurement",
 }
 
+# Lists these are calculated from must be reassigned, not mutated in place,
+# for the cached value to be invalidated
+DERIVED_CACHED_PROPERTIES = {
+    "capability_attributes": {"options", "state_class"},
+}
+
 TEMPERATURE_UNITS = {UnitOfTemperature.CELSIUS, UnitOfTemperature.FAHRENHEIT}
 
 
-class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
+class SensorEntity(
+    Entity,
+    cached_properties=CACHED_PROPERTIES_WITH_ATTR_,
+    derived_cached_properties=DERIVED_CACHED_PROPERTIES,
+):
     """Base class for sensor entities."""
 
     _entity_component_unrecorded_attributes = frozenset({ATTR_OPTIONS})
@@ -354,7 +364,7 @@ class SensorEntity(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             return self.entity_description.last_reset
         return None
 
-    @property
+    @cached_property
     @override
     def capability_attributes(self) -> dict[str, Any] | None:
         """Return the capability attributes."""
@@ -27,7 +27,7 @@ from .const import (
 )
 
 if TYPE_CHECKING:
-    from av import CodecContext, Packet
+    from av import CodecContext, Packet, VideoFrame
 
     from homeassistant.components.camera import DynamicStreamSettings
 
@@ -427,6 +427,9 @@ class KeyFrameConverter:
         _generate_image will clear the packet, so there will only be one attempt per packet
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
+    The decoded keyframe and the images encoded from it for each requested
+    size are kept until the next keyframe arrives, so get_image only runs
+    an executor job for a new keyframe or a size not seen yet
     """
 
     def __init__(
@@ -446,6 +449,8 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._frame: VideoFrame | None = None
+        self._images: dict[tuple[int | None, int | None, int], bytes] = {}
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
         self._codec_context: CodecContext | None = None
@@ -492,8 +497,32 @@ class KeyFrameConverter:
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not (self._turbojpeg and self._codec_context):
             return
+        if self._packet:
+            self._decode_keyframe()
+        if not (frame := self._frame):
+            return
+        orientation = self._dynamic_stream_settings.orientation
+        key = self._image_key(width, height)
+        if (image := self._images.get(key)) is None:
+            if width and height:
+                if orientation >= 5:
+                    frame = frame.reformat(width=height, height=width)
+                else:
+                    frame = frame.reformat(width=width, height=height)
+            bgr_array = self.transform_image(
+                frame.to_ndarray(format="bgr24"), orientation
+            )
+            image = self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
+        self._image = image
+
+    def _decode_keyframe(self) -> None:
+        """Decode the stashed keyframe packet.
+
+        This is run in an executor thread from _generate_image.
+        """
+        assert self._codec_context
         packet = self._packet
         self._packet = None
         for _ in range(2):  # Retry once if codec context needs to be flushed
@@ -513,17 +542,16 @@ class KeyFrameConverter:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
-            frame = frames[0]
-            if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
-            bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
-            )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._frame = frames[0]
+            self._images.clear()
+
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of the encoded image for a requested size."""
+        if width and height:
+            return (width, height, self._dynamic_stream_settings.orientation)
+        return (None, None, self._dynamic_stream_settings.orientation)
 
     async def async_get_image(
         self,
@@ -538,5 +566,13 @@ class KeyFrameConverter:
             self._event.clear()
             await self._event.wait()
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            if (
+                self._packet
+                or (image := self._images.get(self._image_key(width, height))) is None
+            ):
+                await self._hass.async_add_executor_job(
+                    self._generate_image, width, height
+                )
+            else:
+                self._image = image
         return self._image
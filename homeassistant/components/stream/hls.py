@@ -425,9 +425,17 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
+        # Write the parts one at a time rather than joining them so each
+        # request does not make another copy of the segment
+        parts = segment.parts[:]
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = sum(len(part.data) for part in parts)
+        await response.prepare(request)
+        for part in parts:
+            await response.write(part.data)
+        await response.write_eof()
+        return response
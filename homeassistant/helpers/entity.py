@@ -278,6 +278,19 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+
+    A class can also pass derived_cached_properties, a dict mapping the name of a
+    method decorated with @cached_property to the set of cached properties it is
+    calculated from, e.g. capability_attributes calculated from options.
+    - Setting or deleting the _attr_ of a dependency also invalidates the derived
+      cached property
+    - If a subclass overrides any of the dependencies with something which is not
+      a @cached_property, the derived property is not cached for that subclass
+      because there would be no way to know when to invalidate it
+    - Only assignments are tracked, so an _attr_ list or dict a derived property
+      depends on must be replaced with a new object instead of being mutated in
+      place, e.g. an empty source_list that is appended to afterwards would leave
+      it out of the cached capability_attributes
     """
 
     def __new__(
@@ -286,13 +299,18 @@ class CachedProperties(type):
         bases: tuple[type, ...],
         namespace: dict[Any, Any],
         cached_properties: set[str] | None = None,
+        derived_cached_properties: dict[str, set[str]] | None = None,
         **kwargs: Any,
     ) -> Any:
         """Start creating a new CachedProperties.
 
-        Pop cached_properties and store it in the namespace.
+        Pop cached_properties and derived_cached_properties and store them in the
+        namespace.
         """
         namespace["_CachedProperties__cached_properties"] = cached_properties or set()
+        namespace["_CachedProperties__derived_cached_properties"] = (
+            derived_cached_properties or {}
+        )
         return super().__new__(mcs, name, bases, namespace, **kwargs)
 
     def __init__(
@@ -304,10 +322,11 @@ class CachedProperties(type):
     ) -> None:
         """Finish creating a new CachedProperties.
 
-        Wrap _attr_ for cached properties in property objects.
+        Wrap _attr_ for cached properties in property objects and build the map
+        from cached properties to the derived cached properties to invalidate.
         """
 
-        def deleter(name: str) -> Callable[[Any], None]:
+        def deleter(name: str, derived: tuple[str, ...]) -> Callable[[Any], None]:
             """Create a deleter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
 
@@ -325,9 +344,20 @@ class CachedProperties(type):
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
 
-            return _deleter
+            def _deleter_with_derived(o: Any) -> None:
+                """Delete an _attr_ property which other properties derive from.
+
+                Like _deleter, but also invalidates the derived cached properties.
+                """
+                o_dict = o.__dict__
+                o_dict.pop(name, None)
+                for derived_name in derived:
+                    o_dict.pop(derived_name, None)
+                delattr(o, private_attr_name)
 
-        def setter(name: str) -> Callable[[Any, Any], None]:
+            return _deleter_with_derived if derived else _deleter
+
+        def setter(name: str, derived: tuple[str, ...]) -> Callable[[Any, Any], None]:
             """Create a setter for an _attr_ property."""
             private_attr_name = f"__attr_{name}"
 
@@ -343,12 +373,28 @@ class CachedProperties(type):
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
 
-            return _setter
+            def _setter_with_derived(o: Any, val: Any) -> None:
+                """Set an _attr_ property which other properties derive from.
+
+                Like _setter, but also invalidates the derived cached properties.
+                """
+                if getattr(o, private_attr_name, _SENTINEL) == val:
+                    return
+                setattr(o, private_attr_name, val)
+                o_dict = o.__dict__
+                o_dict.pop(name, None)
+                for derived_name in derived:
+                    o_dict.pop(derived_name, None)
+
+            return _setter_with_derived if derived else _setter
 
         def make_property(name: str) -> property:
             """Help create a property object."""
+            derived = derived_dependents.get(name, ())
             return property(
-                fget=attrgetter(f"__attr_{name}"), fset=setter(name), fdel=deleter(name)
+                fget=attrgetter(f"__attr_{name}"),
+                fset=setter(name, derived),
+                fdel=deleter(name, derived),
             )
 
         def wrap_attr(cls: CachedProperties, property_name: str) -> None:
@@ -372,6 +418,9 @@ class CachedProperties(type):
             # Create the _attr_ property
             setattr(cls, attr_name, make_property(property_name))
 
+        # Reverse map used when creating the _attr_ setters and deleters
+        derived_dependents = _build_derived_dependents(cls)
+
         cached_properties: set[str] = namespace["_CachedProperties__cached_properties"]
         seen_props: set[str] = set()  # Keep track of properties which have been handled
         for property_name in cached_properties:
@@ -395,6 +444,55 @@ class CachedProperties(type):
                 wrap_attr(cls, property_name)
                 seen_props.add(property_name)
 
+        # The _attr_ properties inherited from parents don't know about the
+        # derived properties of this class, replace them for the dependencies.
+        for property_name in derived_dependents:
+            if property_name not in seen_props and isinstance(
+                _lookup_class_attr(cls, f"_attr_{property_name}"), property
+            ):
+                setattr(cls, f"_attr_{property_name}", make_property(property_name))
+
+
+def _build_derived_dependents(cls: type) -> dict[str, tuple[str, ...]]:
+    """Map cached properties to the derived cached properties calculated from them.
+
+    Derived cached properties with a dependency which is not a cached property
+    in cls are replaced with a plain property.
+    """
+    # Merge the derived cached properties of the class and its parents
+    derived_cached_properties: dict[str, set[str]] = {}
+    for parent in cls.__mro__[::-1]:
+        if "_CachedProperties__derived_cached_properties" in parent.__dict__:
+            derived_cached_properties.update(
+                parent.__dict__["_CachedProperties__derived_cached_properties"]
+            )
+    derived_dependents: dict[str, tuple[str, ...]] = {}
+    for derived_name, dependencies in derived_cached_properties.items():
+        if not all(
+            isinstance(_lookup_class_attr(cls, dependency), cached_property)
+            for dependency in dependencies
+        ):
+            # A dependency is overridden with something we can't track,
+            # stop caching the derived property for this class.
+            derived = _lookup_class_attr(cls, derived_name)
+            if isinstance(derived, cached_property):
+                setattr(cls, derived_name, property(derived.func))
+            continue
+        for dependency in dependencies:
+            derived_dependents[dependency] = (
+                *derived_dependents.get(dependency, ()),
+                derived_name,
+            )
+    return derived_dependents
+
+
+def _lookup_class_attr(cls: type, name: str) -> Any:
+    """Return a class attribute without invoking the descriptor protocol."""
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass.__dict__[name]
+    return None
+
 
 class ABCCachedProperties(CachedProperties, ABCMeta):
     """Add ABCMeta to CachedProperties."""
@@ -475,6 +573,10 @@ class Entity(
     # to be writable. This is used to avoid repeated checks.
     _verified_state_writable = False
 
+    # If state writes are coalesced by the platform, set after the first
+    # state has been written when the platform opts in
+    _coalesce_state_writes = False
+
     # Process updates in parallel
     parallel_updates: asyncio.Semaphore | None = None
 
@@ -1002,6 +1104,9 @@ class Entity(
             self._async_verify_state_writable()
         if self.hass.loop_thread_id != threading.get_ident():
             report_non_thread_safe_operation("async_write_ha_state")
+        if self._coalesce_state_writes:
+            self.platform.async_schedule_write_ha_state(self)
+            return
         self._async_write_ha_state()
 
     def _stringify_state(self, available: bool) -> str:
@@ -1340,6 +1445,9 @@ class Entity(
         self.platform = platform
         self.parallel_updates = parallel_updates
         self._platform_state = EntityPlatformState.ADDED
+        # Entities re-added after a rename must write their first state
+        # right away again
+        self._coalesce_state_writes = False
 
     def _call_on_remove_callbacks(self) -> None:
         """Call callbacks registered by async_on_remove."""
@@ -1364,6 +1472,9 @@ class Entity(
         await self.async_internal_added_to_hass()
         await self.async_added_to_hass()
         self.async_write_ha_state()
+        # The first state is always written right away so it exists as
+        # soon as the entity has been added
+        self._coalesce_state_writes = self.platform.coalesce_state_writes
 
     @final
     async def async_remove(self, *, force_remove: bool = False) -> None:
@@ -1612,6 +1723,28 @@ class Entity(
             if self.parallel_updates:
                 self.parallel_updates.release()
 
+    async def async_request_service_call[_T](self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Process a service call request.
+
+        Service calls are limited by the PARALLEL_SERVICE_CALLS of the platform
+        if it is set, 0 meaning no limit, otherwise they share the parallel
+        updates limit.
+
+        Service calls limited by PARALLEL_SERVICE_CALLS do not wait for the
+        parallel updates semaphore, so they can run at the same time as an
+        update of the entity. Platforms with a client that is not safe to use
+        concurrently, like the sync platforms serialized by the default
+        PARALLEL_UPDATES of 1, should not set it.
+        """
+        if (platform := self.platform) is None or (
+            platform.parallel_service_calls_limit is None
+        ):
+            return await self.async_request_call(coro)
+        if (parallel_service_calls := platform.parallel_service_calls) is None:
+            return await coro
+        async with parallel_service_calls:
+            return await coro
+
     def _suggest_report_issue(self) -> str:
         """Suggest to report an issue."""
         # The check for self.platform guards against integrations not using an
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from collections.abc import Awaitable, Callable, Coroutine, Hashable, Iterable
 from contextvars import ContextVar
 from datetime import timedelta
 from functools import partial
@@ -156,6 +156,26 @@ class EntityPlatform:
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
 
+        # Platforms can limit concurrent service calls separately from
+        # updates, by default service calls share the parallel updates limit.
+        # Like for PARALLEL_UPDATES, 0 means no limit.
+        self.parallel_service_calls_limit: int | None = getattr(
+            platform, "PARALLEL_SERVICE_CALLS", None
+        )
+        self.parallel_service_calls: asyncio.Semaphore | None = None
+        if self.parallel_service_calls_limit:
+            self.parallel_service_calls = asyncio.Semaphore(
+                self.parallel_service_calls_limit
+            )
+
+        # Platforms can opt in to coalescing state writes of their entities
+        # to once per event loop iteration
+        self.coalesce_state_writes: bool = getattr(
+            platform, "COALESCE_STATE_WRITES", False
+        )
+        self._pending_state_writes: dict[Entity, None] = {}
+        self._pending_state_writes_handle: asyncio.Handle | None = None
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -626,11 +646,21 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
+        device_registry = dev_reg.async_get(hass)
+        # Entities of the same device usually share the same device info
+        # so we only resolve each device once for the whole batch
+        device_ids: dict[Hashable, str] = {}
         coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
             coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
+                self._async_add_entity(
+                    entity,
+                    update_before_add,
+                    entity_registry,
+                    device_registry,
+                    device_ids,
+                )
             )
             entities.append(entity)
 
@@ -704,11 +734,39 @@ class EntityPlatform:
                 already_exists = True
         return (already_exists, restored)
 
+    def _async_get_or_create_device(
+        self,
+        device_registry: dev_reg.DeviceRegistry,
+        device_info: dev_reg.DeviceInfo,
+        device_ids: dict[Hashable, str],
+    ) -> dev_reg.DeviceEntry:
+        """Get or create the device for an entity's device info.
+
+        The device is only created or updated for the first entity with
+        the same device info in a batch of entities being added.
+        """
+        if (
+            (key := _device_info_key(device_info)) is not None
+            and (device_id := device_ids.get(key)) is not None
+            and (device := device_registry.async_get(device_id)) is not None
+        ):
+            return device
+        if TYPE_CHECKING:
+            assert self.config_entry is not None
+        device = device_registry.async_get_or_create(
+            config_entry_id=self.config_entry.entry_id, **device_info
+        )
+        if key is not None:
+            device_ids[key] = device.id
+        return device
+
     async def _async_add_entity(  # noqa: C901
         self,
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        device_registry: dev_reg.DeviceRegistry,
+        device_ids: dict[Hashable, str],
     ) -> None:
         """Add an entity to the platform."""
         if entity is None:
@@ -767,9 +825,8 @@ class EntityPlatform:
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
+                    device = self._async_get_or_create_device(
+                        device_registry, device_info, device_ids
                     )
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
@@ -934,8 +991,41 @@ class EntityPlatform:
                 )
 
         self.async_unsub_polling()
+        if self._pending_state_writes_handle is not None:
+            self._pending_state_writes_handle.cancel()
+            self._pending_state_writes_handle = None
+        self._pending_state_writes.clear()
         self._setup_complete = False
 
+    @callback
+    def async_schedule_write_ha_state(self, entity: Entity) -> None:
+        """Schedule writing the state of an entity.
+
+        All entities that write their state during the same event loop
+        iteration are written together in the next iteration, and
+        multiple writes of the same entity only calculate its state once.
+        """
+        self._pending_state_writes[entity] = None
+        if self._pending_state_writes_handle is None:
+            self._pending_state_writes_handle = self.hass.loop.call_soon(
+                self._async_write_pending_ha_states
+            )
+
+    @callback
+    def _async_write_pending_ha_states(self) -> None:
+        """Write the states of all entities with pending writes."""
+        self._pending_state_writes_handle = None
+        pending = self._pending_state_writes
+        self._pending_state_writes = {}
+        for entity in pending:
+            # Entities removed since the write was scheduled are skipped by
+            # _async_write_ha_state, and one failing entity must not drop
+            # the writes of the others
+            try:
+                entity._async_write_ha_state()  # noqa: SLF001
+            except Exception:
+                self.logger.exception("Error writing state for %s", entity.entity_id)
+
     @callback
     def async_unsub_polling(self) -> None:
         """Stop polling."""
@@ -1063,6 +1153,21 @@ current_platform: ContextVar[EntityPlatform | None] = ContextVar(
 )
 
 
+def _device_info_key(device_info: dev_reg.DeviceInfo) -> Hashable | None:
+    """Return a hashable key for device info or None if it can't be hashed."""
+    key = tuple(
+        sorted(
+            (name, frozenset(value) if isinstance(value, set) else value)
+            for name, value in device_info.items()
+        )
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 @callback
 def async_get_current_platform() -> EntityPlatform:
     """Get the current platform from context."""
@@ -540,13 +540,14 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains seven additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+    - (scope, category_id) -> dict[key, True]
     """
 
     def __init__(self) -> None:
@@ -558,6 +559,9 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._categories_index: defaultdict[
+            tuple[str, str], dict[str, Literal[True]]
+        ] = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -573,6 +577,8 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             self._area_id_index[area_id][key] = True
         for label in entry.labels:
             self._labels_index[label][key] = True
+        for scope_category in entry.categories.items():
+            self._categories_index[scope_category][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -590,6 +596,9 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         if labels := entry.labels:
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
+        if categories := entry.categories:
+            for scope_category in categories.items():
+                self._unindex_entry_value(key, scope_category, self._categories_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
@@ -633,6 +642,15 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
+    def get_entries_for_category(
+        self, scope: str, category_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for a category in a scope."""
+        data = self.data
+        return [
+            data[key] for key in self._categories_index.get((scope, category_id), ())
+        ]
+
 
 def _validate_item(
     hass: HomeAssistant,
@@ -1361,13 +1379,10 @@ class EntityRegistry(BaseRegistry):
     @callback
     def async_clear_category_id(self, scope: str, category_id: str) -> None:
         """Clear category id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if (
-                existing_category_id := entry.categories.get(scope)
-            ) and category_id == existing_category_id:
-                categories = entry.categories.copy()
-                del categories[scope]
-                self.async_update_entity(entity_id, categories=categories)
+        for entry in self.entities.get_entries_for_category(scope, category_id):
+            categories = entry.categories.copy()
+            del categories[scope]
+            self.async_update_entity(entry.entity_id, categories=categories)
 
     @callback
     def async_clear_label_id(self, label_id: str) -> None:
@@ -1460,14 +1475,7 @@ def async_entries_for_category(
     registry: EntityRegistry, scope: str, category_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a category in a scope."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if (
-            (existing_category_id := entry.categories.get(scope))
-            and category_id == existing_category_id
-        )
-    ]
+    return registry.entities.get_entries_for_category(scope, category_id)
 
 
 @callback
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
+from collections.abc import Hashable, Mapping, Sequence, ValuesView
 from typing import TYPE_CHECKING, Any, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
@@ -43,8 +43,11 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
         data[key] = entry
         self._index_entry(key, entry)
 
-    def _unindex_entry_value(
-        self, key: str, value: str, index: RegistryIndexType
+    def _unindex_entry_value[_KeyT: Hashable](
+        self,
+        key: str,
+        value: _KeyT,
+        index: defaultdict[_KeyT, dict[str, Literal[True]]],
     ) -> None:
         """Unindex an entry value.
 
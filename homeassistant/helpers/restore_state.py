@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import cached_property
 import logging
 from typing import Any, Self, cast
 
@@ -96,6 +97,51 @@ class StoredState:
         )
 
 
+class _LazyStoredState(StoredState):
+    """Stored state loaded from storage.
+
+    Most stored states are never restored, or only restored by a single
+    entity, so the state and extra data are only decoded when they are
+    accessed. The JSON dict is written back as is when states are dumped.
+    """
+
+    def __init__(self, json_dict: dict[str, Any], last_seen: datetime) -> None:
+        """Initialize a new lazy stored state."""
+        self.json_dict = json_dict
+        self.last_seen = last_seen
+
+    @classmethod
+    def from_dict(cls, json_dict: dict) -> Self:
+        """Initialize a lazy stored state from a dict."""
+        last_seen = json_dict["last_seen"]
+
+        if isinstance(last_seen, str):
+            last_seen = dt_util.parse_datetime(last_seen)
+
+        return cls(json_dict, last_seen)
+
+    @cached_property
+    def state(self) -> State:  # type: ignore[override]
+        """Return the decoded state."""
+        return cast(State, State.from_dict(self.json_dict["state"]))
+
+    @cached_property
+    def extra_data(self) -> ExtraStoredData | None:  # type: ignore[override]
+        """Return the decoded extra data."""
+        if extra_data_dict := self.json_dict.get("extra_data"):
+            return RestoredExtraData(extra_data_dict)
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the stored state to be JSON serialized."""
+        json_dict = self.json_dict
+        return {
+            "state": json_dict["state"],
+            "extra_data": json_dict.get("extra_data"),
+            "last_seen": self.last_seen,
+        }
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -164,7 +210,7 @@ class RestoreStateData:
             self.last_states = {}
         else:
             self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+                item["state"]["entity_id"]: _LazyStoredState.from_dict(item)
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
@@ -1010,7 +1010,7 @@ async def entity_service_call(
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
+            entity.async_request_service_call(
                 _handle_entity_call(hass, entity, func, data, call.context)
             )
             for entity in entities
@@ -61,6 +61,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting ``max_update_interval`` enables adaptive polling: each scheduled
+    refresh that returns unchanged data doubles the interval until the next
+    refresh, up to ``max_update_interval``. Changed data, a requested refresh
+    or manually updated data reset the interval to ``update_interval``. This
+    also requires that the data implements ``__eq__``.
     """
 
     def __init__(
@@ -74,6 +80,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        max_update_interval: timedelta | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -82,7 +89,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.update_method = update_method
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
+        self._backoff_interval_seconds: float | None = None
         self.update_interval = update_interval
+        self._max_update_interval_seconds = (
+            max_update_interval.total_seconds() if max_update_interval else None
+        )
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
@@ -208,11 +219,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Set interval between updates."""
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
+        self._backoff_interval_seconds = None
 
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self._update_interval_seconds is None:
+        if (update_interval_seconds := self._update_interval_seconds) is None:
             return
 
         if self.config_entry and self.config_entry.pref_disable_polling:
@@ -229,7 +241,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         loop = hass.loop
 
         next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+            int(loop.time())
+            + self._microsecond
+            + (self._backoff_interval_seconds or update_interval_seconds)
         )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
@@ -428,8 +442,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
+            if (max_interval := self._max_update_interval_seconds) is not None:
+                self._async_adjust_backoff(
+                    scheduled and previous_data == self.data, max_interval
+                )
 
         finally:
+            if not self.last_update_success:
+                # Retry at the regular interval instead of the backed off one
+                self._backoff_interval_seconds = None
             if log_timing:
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
@@ -452,6 +473,22 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         ):
             self.async_update_listeners()
 
+    @callback
+    def _async_adjust_backoff(
+        self, unchanged: bool, max_update_interval_seconds: float
+    ) -> None:
+        """Back off the polling interval while the data is unchanged."""
+        if (
+            not unchanged
+            or (update_interval_seconds := self._update_interval_seconds) is None
+        ):
+            self._backoff_interval_seconds = None
+            return
+        self._backoff_interval_seconds = min(
+            (self._backoff_interval_seconds or update_interval_seconds) * 2,
+            max(max_update_interval_seconds, update_interval_seconds),
+        )
+
     @callback
     def _async_refresh_finished(self) -> None:
         """Handle when a refresh has finished.
@@ -478,6 +515,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self.data = data
         self.last_update_success = True
+        self._backoff_interval_seconds = None
         self.logger.debug(
             "Manually updated %s data",
             self.name,
@@ -16,9 +16,15 @@ from homeassistant.auth.models import Credentials
 from homeassistant.bootstrap import DATA_LOGGING
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    label_registry as lr,
+)
 from homeassistant.setup import async_setup_component
 
-from tests.common import CLIENT_ID, MockUser, async_mock_service
+from tests.common import CLIENT_ID, MockConfigEntry, MockUser, async_mock_service
 from tests.typing import ClientSessionGenerator
 
 
@@ -567,6 +573,77 @@ async def test_stream_with_restricted(
         assert data["event_type"] == "test_event3"
 
 
+async def test_stream_with_entity_filter(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the stream only forwards events for the given entities."""
+    async with mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.kitchen"
+    ) as resp:
+        assert resp.status == HTTPStatus.OK
+
+        hass.states.async_set("light.hall", "on")
+        hass.states.async_set("light.kitchen", "on")
+        data = await _stream_next_event(resp.content)
+        assert data["event_type"] == "state_changed"
+        assert data["data"]["entity_id"] == "light.kitchen"
+
+        hass.bus.async_fire("test_event", {"entity_id": ["light.hall"]})
+        hass.bus.async_fire("test_event", {"entity_id": {"light.kitchen": 1}})
+        hass.bus.async_fire(
+            "test_event", {"entity_id": ["light.hall", "light.kitchen"]}
+        )
+        data = await _stream_next_event(resp.content)
+        assert data["event_type"] == "test_event"
+        assert data["data"]["entity_id"] == ["light.hall", "light.kitchen"]
+
+        async_mock_service(hass, "light", "turn_on")
+        await hass.services.async_call(
+            "light", "turn_on", {"entity_id": "light.hall"}, blocking=True
+        )
+        await hass.services.async_call(
+            "light",
+            "turn_on",
+            target={"entity_id": ["light.hall", "light.kitchen"]},
+            blocking=True,
+        )
+        data = await _stream_next_event(resp.content)
+        assert data["event_type"] == "call_service"
+        assert data["data"]["service_data"]["entity_id"] == [
+            "light.hall",
+            "light.kitchen",
+        ]
+
+        await hass.services.async_call(
+            "light",
+            "turn_on",
+            {"entity_id": "light.hall, light.kitchen"},
+            blocking=True,
+        )
+        data = await _stream_next_event(resp.content)
+        assert data["event_type"] == "call_service"
+        assert data["data"]["service_data"]["entity_id"] == (
+            "light.hall, light.kitchen"
+        )
+
+
+async def test_stream_slow_client(
+    hass: HomeAssistant, mock_api_client: TestClient
+) -> None:
+    """Test the stream is closed when the client does not keep up."""
+    listen_count = _listen_count(hass)
+
+    with patch("homeassistant.components.api.STREAM_MAX_PENDING", 2):
+        async with mock_api_client.get(const.URL_API_STREAM) as resp:
+            assert resp.status == HTTPStatus.OK
+            assert listen_count + 1 == _listen_count(hass)
+
+            for _ in range(5):
+                hass.bus.async_fire("test_event")
+            assert listen_count == _listen_count(hass)
+            await resp.read()
+
+
 async def _stream_next_event(stream):
     """Read the stream for next event while ignoring ping."""
     while True:
@@ -711,6 +788,84 @@ async def test_states(
     assert json[1]["entity_id"] == "test.entity2"
 
 
+async def test_states_query_filters(
+    hass: HomeAssistant,
+    mock_api_client: TestClient,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+    label_registry: lr.LabelRegistry,
+) -> None:
+    """Test narrowing down states with query filters."""
+    area = area_registry.async_create("Kitchen")
+    label = label_registry.async_create("Important")
+    entity_registry.async_get_or_create(
+        "light", "test", "1", suggested_object_id="kitchen"
+    )
+    entity_registry.async_update_entity("light.kitchen", area_id=area.id)
+    entity_registry.async_get_or_create(
+        "switch", "test", "1", suggested_object_id="kitchen"
+    )
+    entity_registry.async_update_entity(
+        "switch.kitchen", area_id=area.id, labels={label.label_id}
+    )
+    config_entry = MockConfigEntry(domain="test")
+    config_entry.add_to_hass(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("test", "fridge")},
+    )
+    device_registry.async_update_device(device.id, area_id=area.id)
+    entity_registry.async_get_or_create(
+        "sensor",
+        "test",
+        "1",
+        suggested_object_id="fridge",
+        device_id=device.id,
+        config_entry=config_entry,
+    )
+    for entity_id in (
+        "light.kitchen",
+        "light.hall",
+        "switch.kitchen",
+        "sensor.hall",
+        "sensor.fridge",
+    ):
+        hass.states.async_set(entity_id, "on")
+
+    async def _get_entity_ids(query: dict[str, str]) -> list[str]:
+        resp = await mock_api_client.get(const.URL_API_STATES, params=query)
+        assert resp.status == HTTPStatus.OK
+        return [state["entity_id"] for state in await resp.json()]
+
+    assert await _get_entity_ids({"domain": "light"}) == [
+        "light.hall",
+        "light.kitchen",
+    ]
+    assert await _get_entity_ids({"entity_id": "sensor.hall,light.hall,light.x"}) == [
+        "light.hall",
+        "sensor.hall",
+    ]
+    assert await _get_entity_ids({"area_id": area.id}) == [
+        "light.kitchen",
+        "sensor.fridge",
+        "switch.kitchen",
+    ]
+    # Areas and labels are only matched by id
+    assert await _get_entity_ids({"area_id": "Kitchen"}) == []
+    assert await _get_entity_ids({"label_id": "Important"}) == []
+    assert await _get_entity_ids({"area_id": area.id, "domain": "switch"}) == [
+        "switch.kitchen"
+    ]
+    assert await _get_entity_ids({"label_id": label.label_id}) == ["switch.kitchen"]
+    assert (
+        await _get_entity_ids(
+            {"label_id": label.label_id, "entity_id": "light.kitchen"}
+        )
+        == []
+    )
+
+
 async def test_states_view_filters(
     hass: HomeAssistant,
     hass_read_only_user: MockUser,
@@ -1,11 +1,14 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
-from unittest.mock import AsyncMock, Mock, PropertyMock, mock_open, patch
+from unittest.mock import AsyncMock, Mock, PropertyMock, call, mock_open, patch
 
+from aiohttp import web
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import camera
@@ -14,6 +17,9 @@ from homeassistant.components.camera.const import (
     PREF_ORIENTATION,
     PREF_PRELOAD_STREAM,
 )
+from homeassistant.components.camera.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
 from homeassistant.components.websocket_api import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import (
@@ -1094,3 +1100,116 @@ async def test_entity_picture_url_changes_on_token_update(hass: HomeAssistant) -
     new_entity_picture = camera_state.attributes["entity_picture"]
     assert new_entity_picture != original_picture
     assert "token=" in new_entity_picture
+
+
+@pytest.mark.usefixtures("mock_camera")
+async def test_camera_proxy_image_shared(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test camera proxy requests share fetches and reuse recent snapshots."""
+    client = await hass_client()
+    demo_camera = camera._get_camera_from_entity_id(hass, "camera.demo_camera")
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_camera_image:
+        responses = await asyncio.gather(
+            client.get("/api/camera_proxy/camera.demo_camera"),
+            client.get("/api/camera_proxy/camera.demo_camera"),
+            client.get("/api/camera_proxy/camera.demo_camera?width=4&height=3"),
+            client.get("/api/camera_proxy/camera.demo_camera?width=4&height=3"),
+        )
+        assert [response.status for response in responses] == [HTTPStatus.OK] * 4
+        assert [await response.read() for response in responses] == [b"Test"] * 4
+        # Each size is fetched once, at the size that was requested
+        assert mock_camera_image.mock_calls == [
+            call(width=None, height=None),
+            call(width=4, height=3),
+        ]
+
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert response.status == HTTPStatus.OK
+        assert len(mock_camera_image.mock_calls) == 2
+
+        demo_camera._attr_frame_interval = 0
+        response = await client.get("/api/camera_proxy/camera.demo_camera")
+        assert response.status == HTTPStatus.OK
+        assert len(mock_camera_image.mock_calls) == 3
+
+
+async def test_still_stream_hub_shares_images(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test still stream viewers share the images fetched from the camera."""
+    image_cb = AsyncMock(side_effect=[b"frame1", b"frame2"])
+    hub = camera._StillStreamHub(hass, image_cb, 1)
+
+    assert await asyncio.gather(hub.async_get_image(), hub.async_get_image()) == [
+        b"frame1",
+        b"frame1",
+    ]
+    assert await hub.async_get_image() == b"frame1"
+    assert image_cb.await_count == 1
+
+    freezer.tick(1)
+    assert await hub.async_get_image() == b"frame2"
+    assert image_cb.await_count == 2
+    assert hub.get_diagnostics() == {
+        "viewers": 0,
+        "fps": 2 / camera.STILL_STREAM_FPS_WINDOW,
+    }
+
+
+@pytest.mark.usefixtures("mock_camera_with_device", "mock_camera")
+async def test_still_stream_viewers_share_hub(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test still stream viewers share a hub which is removed with the last one."""
+    config_entry = hass.config_entries.async_entries("demo")[0]
+    entity_id = entity_registry.async_get_entity_id(
+        camera.DOMAIN, "demo", "Demo camera"
+    )
+    assert entity_id is not None
+    demo_camera = camera._get_camera_from_entity_id(hass, entity_id)
+    started = asyncio.Event()
+    release = asyncio.Event()
+    images: list[bytes | None] = []
+
+    async def _mock_still_stream(
+        request: web.Request, image_cb, content_type: str, interval: float
+    ) -> web.StreamResponse:
+        images.append(await image_cb())
+        if len(images) == 2:
+            started.set()
+        await release.wait()
+        return web.StreamResponse()
+
+    with (
+        patch(
+            "homeassistant.components.camera.async_get_still_stream",
+            side_effect=_mock_still_stream,
+        ),
+        patch.object(
+            demo_camera, "async_camera_image", return_value=b"Test"
+        ) as mock_camera_image,
+    ):
+        viewers = [
+            hass.async_create_task(demo_camera.handle_async_still_stream(Mock(), 2.0))
+            for _ in range(2)
+        ]
+        await started.wait()
+
+        assert images == [b"Test", b"Test"]
+        assert mock_camera_image.call_count == 1
+        diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+        assert diagnostics[entity_id]["still_streams"] == {
+            "2.0": {"viewers": 2, "fps": 1 / camera.STILL_STREAM_FPS_WINDOW}
+        }
+
+        release.set()
+        await asyncio.gather(*viewers)
+
+    assert demo_camera._still_stream_hubs == {}
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+    assert "still_streams" not in diagnostics[entity_id]
@@ -5,6 +5,7 @@ from datetime import timedelta
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
@@ -454,6 +455,66 @@ async def test_history_during_period_bad_end_time(
     assert response["error"]["code"] == "invalid_end_time"
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period downsamples to max_points."""
+    now = dt_util.utcnow()
+    freezer.move_to(now)
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    values = [10, 12, 11, 95, 13, 14, 12, 11, 3, 12, 13, 14, 12, 11, 10, 12]
+    for idx, value in enumerate(values):
+        freezer.tick(timedelta(seconds=10))
+        if idx == 6:
+            # Removing the entity records a row without a state
+            hass.states.async_remove("sensor.test")
+            await async_recorder_block_till_done(hass)
+            freezer.tick(timedelta(seconds=1))
+        hass.states.async_set("sensor.test", str(value))
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "minimal_response": True,
+            "no_attributes": True,
+            "max_points": 8,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    sensor_test_history = response["result"]["sensor.test"]
+    assert len(sensor_test_history) <= 8
+    states = [comp_state["s"] for comp_state in sensor_test_history]
+    assert states[0] == "10"
+    assert states[-1] == "12"
+    assert "95" in states
+    assert "3" in states
+    last_updated = [comp_state["lu"] for comp_state in sensor_test_history]
+    assert last_updated == sorted(last_updated)
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.test"],
+            "max_points": 1,
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 async def test_history_stream_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
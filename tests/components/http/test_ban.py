@@ -1,5 +1,6 @@
 """The tests for the Home Assistant HTTP component."""
 
+from collections.abc import Generator
 from http import HTTPStatus
 from ipaddress import ip_address
 import os
@@ -48,13 +49,13 @@ def hassio_env_fixture():
 
 
 @pytest.fixture(autouse=True)
-def gethostbyaddr_mock():
+def gethostbyaddr_mock() -> Generator[Mock]:
     """Fixture to mock out I/O on getting host by address."""
     with patch(
         "homeassistant.components.http.ban.gethostbyaddr",
         return_value=("example.com", ["0.0.0.0.in-addr.arpa"], ["0.0.0.0"]),
-    ):
-        yield
+    ) as mock_gethostbyaddr:
+        yield mock_gethostbyaddr
 
 
 async def test_access_from_banned_ip(
@@ -328,7 +329,9 @@ async def test_ip_bans_file_creation(
 
 
 async def test_failed_login_attempts_counter(
-    hass: HomeAssistant, aiohttp_client: ClientSessionGenerator
+    hass: HomeAssistant,
+    aiohttp_client: ClientSessionGenerator,
+    gethostbyaddr_mock: Mock,
 ) -> None:
     """Testing if failed login attempts counter increased."""
     app = web.Application()
@@ -398,6 +401,9 @@ async def test_failed_login_attempts_counter(
     assert resp.status == HTTPStatus.UNAUTHORIZED
     assert app[KEY_FAILED_LOGIN_ATTEMPTS][remote_ip] == 2
 
+    # The remote host is only looked up once
+    assert len(gethostbyaddr_mock.mock_calls) == 1
+
 
 async def test_single_ban_file_entry(
     hass: HomeAssistant,
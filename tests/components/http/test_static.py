@@ -2,12 +2,18 @@
 
 from http import HTTPStatus
 from pathlib import Path
+from unittest.mock import patch
 
+from aiohttp import hdrs
 from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import (
+    CACHE_HEADER,
+    CachingStaticResource,
+    ImmutableStaticResource,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +69,63 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_not_modified(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test conditional requests for a known ETag are answered from memory."""
+    app = hass.http.app
+    (tmp_path / "file.txt").write_text("content")
+
+    resource = ImmutableStaticResource("/test", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get("/test/file.txt")
+    assert resp.status == HTTPStatus.OK
+    resp = await mock_http_client.get("/test/file.txt")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers[hdrs.ETAG]
+
+    with patch("pathlib.Path.stat", side_effect=AssertionError) as mock_stat:
+        resp = await mock_http_client.get(
+            "/test/file.txt", headers={hdrs.IF_NONE_MATCH: etag}
+        )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+    assert resp.headers[hdrs.ETAG] == etag
+    assert resp.headers[hdrs.CACHE_CONTROL] == CACHE_HEADER
+    assert not mock_stat.called
+
+    resp = await mock_http_client.get(
+        "/test/file.txt", headers={hdrs.IF_NONE_MATCH: '"other"'}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert await resp.text() == "content"
+
+
+async def test_static_resource_modified(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test files of mutable resources are checked on every request."""
+    app = hass.http.app
+    file = tmp_path / "file.txt"
+    file.write_text("content")
+
+    resource = CachingStaticResource("/test", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+
+    resp = await mock_http_client.get("/test/file.txt")
+    assert resp.status == HTTPStatus.OK
+    resp = await mock_http_client.get("/test/file.txt")
+    assert resp.status == HTTPStatus.OK
+    etag = resp.headers[hdrs.ETAG]
+
+    file.write_text("new content")
+    resp = await mock_http_client.get(
+        "/test/file.txt", headers={hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[hdrs.ETAG] != etag
+    assert await resp.text() == "new content"
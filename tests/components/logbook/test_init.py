@@ -254,6 +254,68 @@ async def test_home_assistant_start(hass_) -> None:
     assert_entry(entries[1], pointA, "bla", entity_id=entity_id)
 
 
+def test_context_augmentation_is_cached_per_context(hass_) -> None:
+    """Test the origin of a context is only described once for augmentation."""
+    describe_event = Mock(return_value={"name": "Origin", "message": "fired"})
+    hass_.data[logbook.DOMAIN].external_events["origin_event"] = (
+        "test",
+        describe_event,
+    )
+    context = ha.Context(id="01GTDGKBCH00GW0X476W5TVAAA")
+    entries = mock_humanify(
+        hass_,
+        (
+            MockRow("origin_event", {}, context=context),
+            *(
+                MockRow(
+                    logbook.EVENT_LOGBOOK_ENTRY,
+                    {logbook.ATTR_NAME: name, logbook.ATTR_MESSAGE: "entry"},
+                    context=context,
+                )
+                for name in ("one", "two", "three")
+            ),
+        ),
+    )
+
+    assert len(entries) == 4
+    assert "context_event_type" not in entries[0]
+    for entry in entries[1:]:
+        assert entry["context_event_type"] == "origin_event"
+        assert entry["context_domain"] == "test"
+        assert entry["context_name"] == "Origin"
+        assert entry["context_message"] == "fired"
+    # Once to humanify the origin row and once to augment the three entries
+    assert describe_event.call_count == 2
+
+
+def test_parent_context_found_when_sorted_later(hass_) -> None:
+    """Test a parent context row later in the window is used for augmentation."""
+    parent_context = ha.Context(id="01GTDGKBCH00GW0X476W5TVAAA")
+    child_context = ha.Context(
+        id="01GTDGKBCH00GW0X476W5TVDDD", parent_id=parent_context.id
+    )
+    entries = mock_humanify(
+        hass_,
+        (
+            MockRow(
+                logbook.EVENT_LOGBOOK_ENTRY,
+                {logbook.ATTR_NAME: "child", logbook.ATTR_MESSAGE: "entry"},
+                context=child_context,
+            ),
+            MockRow(
+                EVENT_CALL_SERVICE,
+                {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_on"},
+                context=parent_context,
+            ),
+        ),
+    )
+
+    assert len(entries) == 1
+    assert entries[0]["context_event_type"] == EVENT_CALL_SERVICE
+    assert entries[0]["context_domain"] == "light"
+    assert entries[0]["context_service"] == "turn_on"
+
+
 def test_process_custom_logbook_entries(hass_) -> None:
     """Test if custom log book entries get added as an entry."""
     name = "Nice name"
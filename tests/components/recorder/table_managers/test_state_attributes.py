@@ -0,0 +1,84 @@
+"""Test state attributes table manager."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder.core import Recorder
+from homeassistant.components.recorder.db_schema import StateAttributes
+from homeassistant.components.recorder.table_managers import HashBloomFilter
+from homeassistant.components.recorder.tasks import RecorderTask
+from homeassistant.core import HomeAssistant
+
+from ..common import async_recorder_block_till_done, async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+@dataclass
+class LookupAttributesTask(RecorderTask):
+    """Look up shared attributes on the recorder thread for testing only."""
+
+    shared_attrs_data_hashes: tuple[tuple[str, int], ...]
+    results: dict[str, int | None] = field(default_factory=dict)
+
+    def run(self, instance: Recorder) -> None:
+        """Reset the manager and resolve the shared attributes."""
+        manager = instance.state_attributes_manager
+        manager.reset()
+        self.results = manager.get_many(
+            self.shared_attrs_data_hashes, instance.event_session
+        )
+
+
+def test_hash_bloom_filter() -> None:
+    """Test the hash bloom filter."""
+    hash_filter = HashBloomFilter(100)
+    assert hash_filter.capacity >= 100
+    assert 1234 not in hash_filter
+
+    for data_hash in range(0, 100 * 7919, 7919):
+        hash_filter.add(data_hash)
+
+    assert hash_filter.count == 100
+    assert all(data_hash in hash_filter for data_hash in range(0, 100 * 7919, 7919))
+    assert not hash_filter.overfilled
+
+    for data_hash in range(hash_filter.capacity):
+        hash_filter.add(data_hash)
+    assert hash_filter.overfilled
+
+
+async def test_state_attributes_hash_filter(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test the hash filter skips database lookups for unseen attributes."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_COMMIT_INTERVAL: 0}
+    )
+    hass.states.async_set("sensor.one", "1", {"name": "one"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.one", "2", {"name": "one"})
+    await async_wait_recording_done(hass)
+
+    manager = instance.state_attributes_manager
+    stored_attrs = '{"name":"one"}'
+    stored_hash = StateAttributes.hash_shared_attrs_bytes(stored_attrs.encode())
+    new_attrs = '{"name":"never_stored"}'
+    new_hash = StateAttributes.hash_shared_attrs_bytes(new_attrs.encode())
+
+    task = LookupAttributesTask(((stored_attrs, stored_hash), (new_attrs, new_hash)))
+    instance.queue_task(task)
+    await async_recorder_block_till_done(hass)
+    results = task.results
+    assert results[stored_attrs] is not None
+    assert results[new_attrs] is None
+
+    stats = manager.stats
+    assert stats["filter_items"] == 1
+    assert stats["filter_negatives"] >= 1
+    # The second write found the attributes in the cache
+    assert stats["cache_hits"] >= 1
+    assert stats["cache_misses"] >= 1
+    assert 0 < stats["cache_hit_rate"] < 1
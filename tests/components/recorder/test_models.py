@@ -18,11 +18,13 @@ from homeassistant.components.recorder.models import (
     process_datetime_to_timestamp,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
+    row_to_compressed_state,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import InvalidEntityFormatError
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 
 
@@ -290,6 +292,23 @@ async def test_lazy_state_can_decode_attributes(
     }
 
 
+def test_row_to_compressed_state_passes_through_attributes_json() -> None:
+    """Test compressed states splice the stored attributes json."""
+    row = PropertyMock(
+        attributes='{"shared":true,"nested":{"a":[1,2]}}',
+        last_changed_ts=1.0,
+    )
+    comp_state = row_to_compressed_state(row, {}, None, "sensor.x", "on", 2.0, False)
+    assert isinstance(comp_state["a"], json_fragment)
+    assert json_bytes(comp_state) == (
+        b'{"s":"on","a":{"shared":true,"nested":{"a":[1,2]}},"lu":2.0,"lc":1.0}'
+    )
+
+    row = PropertyMock(attributes="{}", last_changed_ts=None)
+    comp_state = row_to_compressed_state(row, {}, None, "sensor.x", "on", 2.0, False)
+    assert comp_state == {"s": "on", "a": {}, "lu": 2.0}
+
+
 async def test_lazy_state_handles_different_last_updated_and_last_changed(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
@@ -128,3 +128,19 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
     }
+
+
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_attributes_cache(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health shows the state attributes cache hit rate."""
+    assert await async_setup_component(hass, "system_health", {})
+    hass.states.async_set("sensor.one", "1", {"name": "one"})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.one", "2", {"name": "one"})
+    await async_wait_recording_done(hass)
+
+    info = await get_system_health_info(hass, "recorder")
+    assert info["attributes_cache_hit_rate"] == "50.0%"
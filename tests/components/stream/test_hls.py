@@ -415,7 +415,12 @@ async def test_hls_max_segments(
                 duration=SEGMENT_DURATION,
                 has_keyframe=True,
                 data=FAKE_PAYLOAD,
-            )
+            ),
+            Part(
+                duration=SEGMENT_DURATION,
+                has_keyframe=False,
+                data=FAKE_PAYLOAD,
+            ),
         ]
 
     # The segment that fell off the buffer is not accessible
@@ -427,6 +432,8 @@ async def test_hls_max_segments(
     for sequence in range(1, MAX_SEGMENTS + 1):
         segment_response = await hls_client.get(f"/segment/{sequence}.m4s")
         assert segment_response.status == HTTPStatus.OK
+        assert segment_response.content_length == 2 * len(FAKE_PAYLOAD)
+        assert await segment_response.read() == 2 * FAKE_PAYLOAD
 
     stream_worker_sync.resume()
     await stream.stop()
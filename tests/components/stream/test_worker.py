@@ -1015,6 +1015,16 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
 
     assert await stream.async_get_image() == EMPTY_8_6_JPEG
 
+    # Images are encoded once per keyframe and size
+    mock_encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    encode_count = mock_encode.call_count
+    assert await stream.async_get_image() == EMPTY_8_6_JPEG
+    assert mock_encode.call_count == encode_count
+    assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert mock_encode.call_count == encode_count + 1
+    assert await stream.async_get_image(width=4, height=3) == EMPTY_8_6_JPEG
+    assert mock_encode.call_count == encode_count + 1
+
     await stream.stop()
 
 
@@ -2462,6 +2462,68 @@ async def test_cached_entity_property_override(hass: HomeAssistant) -> None:
                 return "🤡"
 
 
+async def test_derived_cached_entity_property(hass: HomeAssistant) -> None:
+    """Test derived cached properties are invalidated with their dependencies."""
+    calls = 0
+
+    class EntityWithDerivedProperty(
+        entity.Entity,
+        derived_cached_properties={"capability_attributes": {"attribution"}},
+    ):
+        """An entity with capability attributes derived from the attribution."""
+
+        @cached_property
+        def capability_attributes(self) -> dict[str, Any] | None:
+            """Return the capability attributes."""
+            nonlocal calls
+            calls += 1
+            return {"attribution": self.attribution}
+
+    class EntityWithUncachedDependency(EntityWithDerivedProperty):
+        """A derived class which overrides a dependency with a plain property."""
+
+        @property
+        def attribution(self) -> str | None:
+            """Return the attribution."""
+            return self._attr_attribution
+
+    ent = EntityWithDerivedProperty()
+    assert ent.capability_attributes == {"attribution": None}
+    assert ent.capability_attributes == {"attribution": None}
+    assert calls == 1
+
+    # Setting the same value does not invalidate
+    ent._attr_attribution = None
+    assert ent.capability_attributes == {"attribution": None}
+    assert calls == 1
+
+    ent._attr_attribution = "abcd"
+    assert ent.capability_attributes == {"attribution": "abcd"}
+    assert calls == 2
+
+    del ent._attr_attribution
+    assert ent.capability_attributes == {"attribution": None}
+    assert calls == 3
+
+    # Unrelated _attr_ writes keep the cache
+    ent._attr_name = "efgh"
+    assert ent.capability_attributes == {"attribution": None}
+    assert calls == 3
+
+    calls = 0
+    ent = EntityWithUncachedDependency()
+    assert ent.capability_attributes == {"attribution": None}
+    assert ent.capability_attributes == {"attribution": None}
+    assert calls == 2
+
+    # Only setters of dependencies invalidate derived properties
+    assert EntityWithDerivedProperty._attr_attribution.fset.__name__ == (
+        "_setter_with_derived"
+    )
+    assert EntityWithDerivedProperty._attr_name.fset.__name__ == "_setter"
+    assert entity.Entity._attr_attribution.fset.__name__ == "_setter"
+
+
 async def test_entity_report_deprecated_supported_features_values(
     caplog: pytest.LogCaptureFixture,
 ) -> None:
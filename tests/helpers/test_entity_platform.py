@@ -9,7 +9,14 @@ from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, PERCENTAGE, EntityCategory
+from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    PERCENTAGE,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    EntityCategory,
+)
 from homeassistant.core import (
     CoreState,
     HomeAssistant,
@@ -40,6 +47,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockPlatform,
+    async_capture_events,
     async_fire_time_changed,
     mock_platform,
     mock_registry,
@@ -385,6 +393,79 @@ async def test_parallel_updates_async_platform_with_constant(
     assert handle._update_in_sequence is False
 
 
+async def test_coalesce_state_writes(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a platform can coalesce state writes to once per loop iteration."""
+    platform = MockPlatform()
+    platform.COALESCE_STATE_WRITES = True
+
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.coalesce_state_writes is True
+
+    entities = [MockEntity(name=f"test {idx}", unique_id=str(idx)) for idx in range(3)]
+    await handle.async_add_entities(entities)
+    # The initial state is written right away
+    for entity in entities:
+        assert hass.states.get(entity.entity_id).state == STATE_UNKNOWN
+
+    state_changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+    for value in ("1", "2", "3"):
+        for entity in entities:
+            entity._attr_state = value
+            entity.async_write_ha_state()
+
+    assert len(state_changes) == 0
+    assert hass.states.get(entities[0].entity_id).state == STATE_UNKNOWN
+
+    await hass.async_block_till_done()
+    assert len(state_changes) == 3
+    for entity in entities:
+        assert hass.states.get(entity.entity_id).state == "3"
+
+    # A failing write does not drop the other writes of the batch
+    for entity in entities:
+        entity._attr_state = "failed"
+        entity.async_write_ha_state()
+    with patch.object(entities[0], "_async_write_ha_state", side_effect=ValueError):
+        await hass.async_block_till_done()
+    assert f"Error writing state for {entities[0].entity_id}" in caplog.text
+    assert hass.states.get(entities[0].entity_id).state == "3"
+    for entity in entities[1:]:
+        assert hass.states.get(entity.entity_id).state == "failed"
+
+    # An entity re-added after a rename writes its first state right away
+    with patch.object(
+        handle,
+        "async_schedule_write_ha_state",
+        wraps=handle.async_schedule_write_ha_state,
+    ) as mock_schedule_write:
+        entity_registry.async_update_entity(
+            entities[2].entity_id, new_entity_id="test_domain.renamed"
+        )
+        await hass.async_block_till_done()
+    assert hass.states.get("test_domain.renamed").state == "failed"
+    assert not mock_schedule_write.called
+
+    # Pending writes are dropped when the platform is reset
+    entity_id = entities[0].entity_id
+    entities[0]._attr_state = "4"
+    entities[0].async_write_ha_state()
+    await handle.async_reset()
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
     """Test sync platform parallel_updates default set to 1."""
     platform = MockPlatform()
@@ -459,6 +540,55 @@ async def test_parallel_updates_sync_platform_with_constant(
     assert entity.parallel_updates._value == 2
 
 
+@pytest.mark.parametrize(
+    ("parallel_service_calls", "expected_concurrency"), [(None, 1), (0, 4), (2, 2)]
+)
+async def test_parallel_service_calls(
+    hass: HomeAssistant,
+    parallel_service_calls: int | None,
+    expected_concurrency: int,
+) -> None:
+    """Test a platform can limit service calls separately from updates."""
+    platform = MockPlatform()
+    if parallel_service_calls is not None:
+        platform.PARALLEL_SERVICE_CALLS = parallel_service_calls
+
+    entity_platform = MockEntityPlatform(
+        hass,
+        domain="mock_integration",
+        platform_name="mock_platform",
+        platform=platform,
+    )
+
+    class SyncEntity(MockEntity):
+        """Mock entity that has update."""
+
+        def update(self):
+            pass
+
+    entities = [
+        SyncEntity(entity_id=f"mock_integration.entity_{idx}") for idx in range(4)
+    ]
+    await entity_platform.async_add_entities(entities)
+    assert entities[0].parallel_updates._value == 1
+
+    running = 0
+    max_running = 0
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    entity_platform.async_register_entity_service("hello", {}, handle_service)
+    await hass.services.async_call(
+        "mock_platform", "hello", {"entity_id": "all"}, blocking=True
+    )
+    assert max_running == expected_concurrency
+
+
 async def test_parallel_updates_async_platform_updates_in_parallel(
     hass: HomeAssistant,
 ) -> None:
@@ -1190,6 +1320,71 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_device_info_resolved_once_per_batch(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entities sharing device info only resolve the device once."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+
+    def _device_info() -> DeviceInfo:
+        return {
+            "identifiers": {("hue", "1234")},
+            "connections": {(dr.CONNECTION_NETWORK_MAC, "abcd")},
+            "name": "test-name",
+        }
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(unique_id=f"qwer{idx}", device_info=_device_info())
+                for idx in range(5)
+            ]
+            + [
+                MockEntity(
+                    unique_id="other",
+                    device_info={"identifiers": {("hue", "5678")}},
+                ),
+                MockEntity(
+                    unique_id="placeholders",
+                    device_info={
+                        "identifiers": {("hue", "5678")},
+                        "translation_placeholders": {"name": "test"},
+                    },
+                ),
+            ]
+        )
+        return True
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with patch.object(
+        device_registry,
+        "async_get_or_create",
+        wraps=device_registry.async_get_or_create,
+    ) as mock_get_or_create:
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 7
+    # One call for each distinct device info, device info which can't be
+    # hashed is always resolved
+    assert len(mock_get_or_create.mock_calls) == 3
+
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert device is not None
+    entity_registry = er.async_get(hass)
+    for idx in range(5):
+        entity_id = entity_registry.async_get_entity_id(
+            DOMAIN, config_entry.domain, f"qwer{idx}"
+        )
+        assert entity_registry.async_get(entity_id).device_id == device.id
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
@@ -299,7 +299,7 @@ async def test_loading_saving_data(
     )
     entity_registry.async_update_entity(
         orig_entry2.entity_id,
-        categories={"scope", "id"},
+        categories={"scope": "id"},
         labels={"label1", "label2"},
     )
     orig_entry2 = entity_registry.async_get(orig_entry2.entity_id)
@@ -334,7 +334,7 @@ async def test_loading_saving_data(
     assert attr.evolve(orig_entry4, modified_at=new_entry4.modified_at) == new_entry4
 
     assert new_entry2.area_id == "mock-area-id"
-    assert new_entry2.categories == {"scope", "id"}
+    assert new_entry2.categories == {"scope": "id"}
     assert new_entry2.capabilities == {"max": 100}
     assert new_entry2.config_entry_id == mock_config.entry_id
     assert new_entry2.device_class == "user-class"
@@ -2050,6 +2050,34 @@ async def test_entries_for_category(entity_registry: er.EntityRegistry) -> None:
     assert not er.async_entries_for_category(entity_registry, "scope1", "")
 
 
+async def test_entries_for_category_index_updated(
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the category index follows updates and removals of entries."""
+    entry = entity_registry.async_get_or_create(
+        domain="light",
+        platform="hue",
+        unique_id="123",
+    )
+    entity_registry.async_update_entity(entry.entity_id, categories={"scope1": "id"})
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_category(entity_registry, "scope1", "id")
+    ] == [entry.entity_id]
+
+    entity_registry.async_update_entity(entry.entity_id, categories={"scope1": "new"})
+    assert not er.async_entries_for_category(entity_registry, "scope1", "id")
+    assert er.async_entries_for_category(entity_registry, "scope1", "new")
+
+    entity_registry.async_clear_category_id("scope1", "new")
+    assert not er.async_entries_for_category(entity_registry, "scope1", "new")
+    assert entity_registry.async_get(entry.entity_id).categories == {}
+
+    entity_registry.async_update_entity(entry.entity_id, categories={"scope1": "id"})
+    entity_registry.async_remove(entry.entity_id)
+    assert not er.async_entries_for_category(entity_registry, "scope1", "id")
+
+
 async def test_get_or_create_thread_safety(
     hass: HomeAssistant, entity_registry: er.EntityRegistry
 ) -> None:
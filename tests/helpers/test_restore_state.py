@@ -466,6 +466,60 @@ async def test_restoring_invalid_entity_id(
     assert state is None
 
 
+async def test_stored_states_decoded_lazily(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test stored states are only decoded when they are restored."""
+    now = dt_util.utcnow().isoformat()
+    stored_items = [
+        {
+            "state": {
+                "entity_id": f"input_boolean.b{idx}",
+                "state": "on",
+                "attributes": {"idx": idx},
+                "last_changed": now,
+                "last_updated": now,
+                "context": {"id": f"context{idx}", "user_id": None},
+            },
+            "extra_data": {"native_value": idx} if idx else None,
+            "last_seen": now,
+        }
+        for idx in range(2)
+    ]
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": stored_items,
+    }
+    await async_load(hass)
+    data = async_get(hass)
+
+    stored_state = data.last_states["input_boolean.b1"]
+    assert "state" not in stored_state.__dict__
+    assert stored_state.last_seen == dt_util.parse_datetime(now)
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    state = await entity.async_get_last_state()
+    assert state is not None
+    assert state.state == "on"
+    assert state.attributes == {"idx": 1}
+    assert state.context.id == "context1"
+    extra_data = await entity.async_get_last_extra_data()
+    assert extra_data.as_dict() == {"native_value": 1}
+    assert "state" not in data.last_states["input_boolean.b0"].__dict__
+
+    # States which were never restored are dumped as they were loaded
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    written_states = json_round_trip(mock_write_data.mock_calls[0][1][0])
+    assert written_states == stored_items
+
+
 async def test_restore_entity_end_to_end(
     hass: HomeAssistant, hass_storage: dict[str, Any]
 ) -> None:
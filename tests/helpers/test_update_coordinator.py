@@ -370,6 +370,85 @@ async def test_update_interval(
     assert crd.data == 2
 
 
+async def test_adaptive_update_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test polling backs off while data is unchanged."""
+    data = 1
+    calls = 0
+    fail = False
+
+    async def refresh() -> int:
+        nonlocal calls
+        calls += 1
+        if fail:
+            raise update_coordinator.UpdateFailed
+        return data
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        max_update_interval=DEFAULT_UPDATE_INTERVAL * 4,
+    )
+    unsub = crd.async_add_listener(Mock())
+
+    async def _tick(interval: timedelta) -> None:
+        freezer.tick(interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # The first refresh sees new data and schedules at the normal interval
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 1
+
+    # Unchanged data doubles the interval
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 2
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 2
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 3
+
+    # Capped at the max update interval
+    await _tick(DEFAULT_UPDATE_INTERVAL * 3)
+    assert calls == 3
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 4
+    await _tick(DEFAULT_UPDATE_INTERVAL * 3)
+    assert calls == 4
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 5
+
+    # Changed data resets the interval
+    data = 2
+    await _tick(DEFAULT_UPDATE_INTERVAL * 4)
+    assert calls == 6
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 7
+
+    # A requested refresh resets the interval
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 7
+    await crd.async_refresh()
+    assert calls == 8
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 9
+
+    # A failed refresh retries at the normal interval
+    fail = True
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 9
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 10
+    await _tick(DEFAULT_UPDATE_INTERVAL)
+    assert calls == 11
+
+    unsub()
+
+
 async def test_update_interval_not_present(
     hass: HomeAssistant,
     crd_without_update_interval: update_coordinator.DataUpdateCoordinator[int],